@@ -8,50 +8,28 @@ the icon in the Dock and in Finder.
 import os
 import sys
 import shutil
+import platform
 import subprocess
 from pathlib import Path
 
+# Project root and build output directory
+_PROJECT_ROOT = Path(__file__).resolve().parent
+_BUILD_DIR = _PROJECT_ROOT / "build"
 
-def build_app_bundle():
-    """Build macOS .app bundle"""
-
-    # Project root
-    project_root = Path(__file__).parent
-
-    # App bundle structure
-    app_name = "DocuRuleFix"
-    app_bundle = project_root / "build" / f"{app_name}.app"
-    contents_dir = app_bundle / "Contents"
-    macos_dir = contents_dir / "MacOS"
-    resources_dir = contents_dir / "Resources"
-
-    # Clean existing build
-    if app_bundle.exists():
-        shutil.rmtree(app_bundle)
-
-    # Create directory structure
-    macos_dir.mkdir(parents=True)
-    resources_dir.mkdir(parents=True)
+# Buffer size for the read/write fallback of _fast_copy
+_COPY_BUFSIZE = 1024 * 1024
 
-    # Copy icon
-    icon_source = project_root / "src" / "resources" / "icons" / "DocuRuleFix.icns"
-    icon_dest = resources_dir / "DocuRuleFix.icns"
-    if icon_source.exists():
-        shutil.copy2(icon_source, icon_dest)
-        print(f"✓ Copied icon: {icon_dest}")
-    else:
-        print(f"✗ Icon not found: {icon_source}")
-        return False
+APP_NAME = "DocuRuleFix"
 
-    # Create Info.plist
-    info_plist = f"""<?xml version="1.0" encoding="UTF-8"?>
+# Bundle file contents, pre-encoded once at import
+_INFO_PLIST = b"""<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
 <plist version="1.0">
 <dict>
     <key>CFBundleDisplayName</key>
-    <string>{app_name}</string>
+    <string>__APP_NAME__</string>
     <key>CFBundleExecutable</key>
-    <string>{app_name}</string>
+    <string>__APP_NAME__</string>
     <key>CFBundleIconFile</key>
     <string>DocuRuleFix.icns</string>
     <key>CFBundleIdentifier</key>
@@ -59,7 +37,7 @@ def build_app_bundle():
     <key>CFBundleInfoDictionaryVersion</key>
     <string>6.0</string>
     <key>CFBundleName</key>
-    <string>{app_name}</string>
+    <string>__APP_NAME__</string>
     <key>CFBundlePackageType</key>
     <string>APPL</string>
     <key>CFBundleShortVersionString</key>
@@ -74,18 +52,13 @@ def build_app_bundle():
     <string>NSApplication</string>
 </dict>
 </plist>
-"""
+""".replace(b"__APP_NAME__", APP_NAME.encode())
 
-    plist_path = contents_dir / "Info.plist"
-    plist_path.write_text(info_plist)
-    print(f"✓ Created Info.plist: {plist_path}")
-
-    # Create launcher script
-    launcher_script = f"""#!/bin/bash
-# Launcher script for {app_name}
+_LAUNCHER_SCRIPT = b"""#!/bin/bash
+# Launcher script for __APP_NAME__
 
 # Get the directory where this script is located
-SCRIPT_DIR="$( cd "$( dirname "${{BASH_SOURCE[0]}}" )" && pwd )"
+SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
 PROJECT_ROOT="$(dirname "$SCRIPT_DIR")"
 
 # Activate virtual environment if it exists
@@ -97,16 +70,138 @@ fi
 # Run the application
 cd "$PROJECT_ROOT"
 exec python3 -m gui.main_window "$@"
-"""
+""".replace(b"__APP_NAME__", APP_NAME.encode())
 
-    launcher_path = macos_dir / app_name
-    launcher_path.write_text(launcher_script)
-    launcher_path.chmod(0o755)
-    print(f"✓ Created launcher: {launcher_path}")
 
-    # Copy PList (PkgInfo) file
+def _fast_copy(src, dst):
+    """Copy a file using the platform fast path, preserving metadata like shutil.copy2
+
+    Uses CopyFileW on Windows and os.sendfile on POSIX. Platforms where
+    sendfile cannot target a regular file (e.g. macOS) fall back to a
+    1 MiB buffered copy.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+    """
+    if sys.platform == 'win32':
+        import ctypes
+        if not ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            raise ctypes.WinError()
+    else:
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            size = os.fstat(src_fd).st_size
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                offset = 0
+                try:
+                    while offset < size:
+                        sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                except OSError:
+                    if offset:
+                        raise
+                    # sendfile not supported for this fd pair
+                    buf = bytearray(_COPY_BUFSIZE)
+                    view = memoryview(buf)
+                    while True:
+                        n = os.readv(src_fd, [buf])
+                        if not n:
+                            break
+                        os.write(dst_fd, view[:n])
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+    shutil.copystat(src, dst)
+
+
+def _fast_rmtree(path):
+    """Remove a directory tree with the platform's native tool
+
+    Runs `rmdir /S /Q` on Windows and `rm -rf` elsewhere, falling back to
+    shutil.rmtree when the tool is missing or leaves the tree behind.
+
+    Args:
+        path: Directory to remove
+    """
+    if sys.platform == 'win32':
+        cmd = ['cmd', '/c', 'rmdir', '/S', '/Q', str(path)]
+    else:
+        cmd = ['rm', '-rf', str(path)]
+
+    try:
+        subprocess.run(cmd, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        pass
+
+    if os.path.exists(path):
+        shutil.rmtree(path)
+
+
+def _write_files(files):
+    """Write several small files, one open + writev per file
+
+    The file mode is applied at creation time so executables need no
+    follow-up chmod.
+
+    Args:
+        files: Iterable of (path, data bytes, mode) tuples
+    """
+    for path, data, mode in files:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            os.writev(fd, [memoryview(data)])
+        finally:
+            os.close(fd)
+
+
+def build_app_bundle():
+    """Build macOS .app bundle"""
+
+    project_root = _PROJECT_ROOT
+
+    # App bundle structure
+    app_name = APP_NAME
+    app_bundle = _BUILD_DIR / f"{app_name}.app"
+    contents_dir = app_bundle / "Contents"
+    macos_dir = contents_dir / "MacOS"
+    resources_dir = contents_dir / "Resources"
+
+    # Clean existing build
+    if app_bundle.exists():
+        _fast_rmtree(app_bundle)
+
+    # Create directory structure
+    for leaf_dir in (macos_dir, resources_dir):
+        os.makedirs(leaf_dir, exist_ok=True)
+
+    # Copy icon
+    icon_source = project_root / "src" / "resources" / "icons" / "DocuRuleFix.icns"
+    icon_dest = resources_dir / "DocuRuleFix.icns"
+    try:
+        _fast_copy(icon_source, icon_dest)
+    except FileNotFoundError:
+        print(f"✗ Icon not found: {icon_source}")
+        return False
+    print(f"✓ Copied icon: {icon_dest}")
+
+    # Write Info.plist, launcher and PkgInfo in one batch
+    plist_path = contents_dir / "Info.plist"
+    launcher_path = macos_dir / app_name
     pkginfo_path = contents_dir / "PkgInfo"
-    pkginfo_path.write_text("APPL????")
+    _write_files([
+        (plist_path, _INFO_PLIST, 0o644),
+        (launcher_path, _LAUNCHER_SCRIPT, 0o755),
+        (pkginfo_path, b"APPL????", 0o644),
+    ])
+    print(f"✓ Created Info.plist: {plist_path}")
+    print(f"✓ Created launcher: {launcher_path}")
     print(f"✓ Created PkgInfo: {pkginfo_path}")
 
     print(f"\n✓ App bundle created: {app_bundle}")
@@ -118,36 +213,56 @@ exec python3 -m gui.main_window "$@"
     return True
 
 
+def _dmg_format():
+    """Pick the DMG image format
+
+    ULFO (LZFSE) compresses much faster than UDZO (zlib) and is readable
+    on macOS 10.11+; older systems get UDZO.
+
+    Returns:
+        hdiutil -format value
+    """
+    release = platform.mac_ver()[0]
+    try:
+        major, minor = (int(part) for part in (release.split('.') + ['0'])[:2])
+    except ValueError:
+        return 'UDZO'
+    return 'ULFO' if (major, minor) >= (10, 11) else 'UDZO'
+
+
 def create_dmg():
     """Optional: Create a DMG installer"""
-    project_root = Path(__file__).parent
-    app_bundle = project_root / "build" / "DocuRuleFix.app"
+    app_bundle = _BUILD_DIR / "DocuRuleFix.app"
 
     if not app_bundle.exists():
         print("✗ App bundle not found. Run build first.")
         return False
 
-    dmg_path = project_root / "build" / "DocuRuleFix.dmg"
+    dmg_path = _BUILD_DIR / "DocuRuleFix.dmg"
 
     # Remove existing DMG
-    if dmg_path.exists():
-        dmg_path.unlink()
+    dmg_path.unlink(missing_ok=True)
 
-    # Create DMG using hdiutil
-    try:
-        subprocess.run([
-            'hdiutil', 'create',
-            '-volname', 'DocuRuleFix',
-            '-srcfolder', str(app_bundle.parent),
-            '-ov', '-format', 'UDZO',
-            str(dmg_path)
-        ], check=True)
-        print(f"✓ DMG created: {dmg_path}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to create DMG: {e}")
-        return False
+    # Create DMG using hdiutil, falling back to UDZO if LZFSE is rejected
+    formats = [_dmg_format()]
+    if formats[0] != 'UDZO':
+        formats.append('UDZO')
+
+    for dmg_format in formats:
+        try:
+            subprocess.run([
+                'hdiutil', 'create',
+                '-volname', 'DocuRuleFix',
+                '-srcfolder', str(app_bundle.parent),
+                '-ov', '-format', dmg_format,
+                str(dmg_path)
+            ], check=True)
+            print(f"✓ DMG created ({dmg_format}): {dmg_path}")
+            return True
+        except subprocess.CalledProcessError as e:
+            print(f"✗ Failed to create DMG ({dmg_format}): {e}")
 
+    return False
 
 if __name__ == "__main__":
     if build_app_bundle():
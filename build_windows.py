@@ -6,23 +6,193 @@ For building DocuRuleFix standalone executable on Windows.
 
 Usage:
     python build_windows.py
+    python build_windows.py --isolated-cache   # 使用独立的临时 PyInstaller 缓存目录，可与其他构建并行
+    python build_windows.py --clean            # 清空 PyInstaller 缓存后完整重建
+
+PyInstaller 缓存保存在 .pyi-cache/<hash> 下，hash 由 spec 文件和
+requirements.txt 的内容计算；两者未变化时复用上次的缓存。
 
 Dependencies:
     pip install pyinstaller
 """
 
 import os
+import re
 import sys
+import stat
 import shutil
 import subprocess
+import tempfile
+import hashlib
+import time
 from pathlib import Path
 
+# 项目根目录及构建输出目录
+_PROJECT_ROOT = Path(__file__).resolve().parent
+_DIST_DIR = _PROJECT_ROOT / "dist"
+
+# PyInstaller 缓存保留天数
+CACHE_MAX_AGE_DAYS = 30
+
+# PyInstaller 日志行格式："<毫秒数> <级别>: <消息>"
+PYINSTALLER_LOG_RE = re.compile(r'^\d+ ([A-Z]+): (.*)$')
+# 标记构建阶段切换的 INFO 消息前缀
+PYINSTALLER_PHASE_PREFIXES = ("Building ", "Appending ", "Copying ", "Fixing ")
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
+# NSIS 安装脚本内容（导入时编码一次）
+_NSIS_SCRIPT = """; DocuRuleFix 安装脚本
+; 需要安装 NSIS: https://nsis.sourceforge.io/
+
+!define APP_NAME "DocuRuleFix"
+!define APP_VERSION "1.0.0"
+!define APP_PUBLISHER "DocuRuleFix"
+!define APP_EXE "DocuRuleFix.exe"
+
+; 现代 UI
+!include "MUI2.nsh"
+
+; general
+Name "${APP_NAME}"
+OutFile "Dist/${APP_NAME}-Setup-${APP_VERSION}.exe"
+InstallDir "$PROGRAMFILES\\${APP_NAME}"
+InstallDirRegKey HKCU "Software\\${APP_NAME}" ""
+RequestExecutionLevel admin
+
+; variables
+Var StartMenuFolder
+
+; interface settings
+!define MUI_ABORTWARNING
+!define MUI_ICON "src\\\\resources\\\\icons\\\\DocuRuleFix.ico"
+!define MUI_UNICON "src\\\\resources\\\\icons\\\\DocuRuleFix.ico"
+
+; pages
+!insertmacro MUI_PAGE_WELCOME
+!insertmacro MUI_PAGE_LICENSE "LICENSE"
+!insertmacro MUI_PAGE_COMPONENTS
+!insertmacro MUI_PAGE_DIRECTORY
+!insertmacro MUI_PAGE_STARTMENU Application $StartMenuFolder
+!insertmacro MUI_PAGE_INSTFILES
+!insertmacro MUI_PAGE_FINISH
+
+!insertmacro MUI_UNPAGE_WELCOME
+!insertmacro MUI_UNPAGE_CONFIRM
+!insertmacro MUI_UNPAGE_INSTFILES
+!insertmacro MUI_UNPAGE_FINISH
+
+; languages
+!insertmacro MUI_LANGUAGE "SimpChinese"
+!insertmacro MUI_LANGUAGE "English"
+
+; installer sections
+Section "主程序" SecMain
+    SectionIn RO
+
+    SetOutPath "$INSTDIR"
+    File "dist\\${APP_EXE}"
+
+    ; 创建开始菜单快捷方式
+    CreateDirectory "$SMPROGRAMS\\$StartMenuFolder"
+    CreateShortcut "$SMPROGRAMS\\$StartMenuFolder\\${APP_NAME}.lnk" \\
+        "$INSTDIR\\${APP_EXE}" "" \\
+        "$INSTDIR\\${APP_EXE}" 0
+
+    ; 创建桌面快捷方式
+    CreateShortcut "$DESKTOP\\${APP_NAME}.lnk" \\
+        "$INSTDIR\\${APP_EXE}" "" \\
+        "$INSTDIR\\${APP_EXE}" 0
+
+    ; 写入注册表
+    WriteRegStr HKCU "Software\\${APP_NAME}" "" $INSTDIR
+    WriteRegStr HKCU "Software\\${APP_NAME}" "version" "${APP_VERSION}"
+
+    ; 写入卸载信息
+    WriteUninstaller "$INSTDIR\\uninstall.exe"
+    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APP_NAME}" \\
+        "DisplayName" "${APP_NAME}"
+    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APP_NAME}" \\
+        "UninstallString" "$INSTDIR\\uninstall.exe"
+    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APP_NAME}" \\
+        "Publisher" "${APP_PUBLISHER}"
+    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APP_NAME}" \\
+        "DisplayVersion" "${APP_VERSION}"
+    WriteRegDWORD HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APP_NAME}" \\
+        "NoModify" 1
+    WriteRegDWORD HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APP_NAME}" \\
+        "NoRepair" 1
+SectionEnd
+
+; uninstaller section
+Section "Uninstall"
+    Delete "$INSTDIR\\${APP_EXE}"
+    Delete "$INSTDIR\\uninstall.exe"
+    Delete "$SMPROGRAMS\\$StartMenuFolder\\${APP_NAME}.lnk"
+    Delete "$DESKTOP\\${APP_NAME}.lnk"
+    RMDir "$SMPROGRAMS\\$StartMenuFolder"
+    RMDir "$INSTDIR"
+
+    DeleteRegKey HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APP_NAME}"
+    DeleteRegKey HKCU "Software\\${APP_NAME}"
+SectionEnd
+""".encode("utf-8")
+
+
+def _scandir_rmtree(root):
+    """使用 os.scandir 迭代删除目录树
+
+    深度优先遍历时直接删除文件，最后自底向上删除目录，
+    不经过 shutil.rmtree 的逐文件回调。
+
+    Args:
+        root: 要删除的目录
+    """
+    dirs = []
+    stack = [os.fspath(root)]
+    while stack:
+        path = stack.pop()
+        dirs.append(path)
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                try:
+                    os.unlink(entry.path)
+                except PermissionError:
+                    # Windows 下只读文件需要先去掉只读属性
+                    os.chmod(entry.path, stat.S_IWRITE)
+                    os.unlink(entry.path)
+
+    # 子目录总是在父目录之后入列，倒序即可保证先删子目录
+    for path in reversed(dirs):
+        os.rmdir(path)
+
+
+def _fast_rmtree(path):
+    """删除目录树
+
+    Windows 下优先执行 `rmdir /S /Q`，未删除干净时使用 _scandir_rmtree。
+
+    Args:
+        path: 要删除的目录
+    """
+    if sys.platform == 'win32':
+        try:
+            subprocess.run(['cmd', '/c', 'rmdir', '/S', '/Q', str(path)],
+                           check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except (OSError, subprocess.CalledProcessError):
+            pass
+
+    if os.path.exists(path):
+        _scandir_rmtree(path)
+
 
 def check_dependencies():
     """检查构建依赖"""
@@ -41,7 +211,7 @@ def check_dependencies():
 
 def check_icon():
     """检查图标文件"""
-    icon_path = Path(__file__).parent / "src" / "resources" / "icons" / "DocuRuleFix.ico"
+    icon_path = _PROJECT_ROOT / "src" / "resources" / "icons" / "DocuRuleFix.ico"
 
     if icon_path.exists():
         print(f"  ✓ 图标文件: {icon_path}")
@@ -57,7 +227,7 @@ def clean_build():
     """清理之前的构建结果"""
     print("\n清理之前的构建...")
 
-    project_root = Path(__file__).parent
+    project_root = _PROJECT_ROOT
     build_dirs = [
         project_root / "build",
         project_root / "dist",
@@ -67,152 +237,201 @@ def clean_build():
     for dir_path in build_dirs:
         if dir_path.exists():
             print(f"  删除: {dir_path}")
-            shutil.rmtree(dir_path)
+            # 优先使用系统命令，剩余部分由 _scandir_rmtree 删除
+            _fast_rmtree(dir_path)
 
 
-def build_executable():
-    """构建可执行文件"""
-    print("\n开始构建...")
+def _fast_copy(src, dst):
+    """复制文件，Windows 下使用系统 CopyFileW 快速复制
 
-    project_root = Path(__file__).parent
-    spec_file = project_root / "DocuRuleFix.spec"
+    CopyFileW 不可用或调用失败时回退到 shutil.copy2。
 
-    if not spec_file.exists():
-        print(f"  ✗ 配置文件不存在: {spec_file}")
-        return False
+    Args:
+        src: 源文件路径
+        dst: 目标文件路径
+    """
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            if ctypes.windll.kernel32.CopyFileW(
+                    ctypes.c_wchar_p(str(src)),
+                    ctypes.c_wchar_p(str(dst)),
+                    ctypes.c_bool(False)):
+                return
+        except (ImportError, AttributeError, OSError):
+            pass
 
-    # PyInstaller 命令
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--clean",
-        str(spec_file),
-    ]
+    shutil.copy2(src, dst)
+
+
+def _file_hash(path):
+    """计算文件内容的 BLAKE2b 哈希
+
+    Args:
+        path: 文件路径
+
+    Returns:
+        十六进制哈希字符串
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()
 
-    print(f"  执行命令: {' '.join(cmd)}")
 
+def _need_copy(src, dst):
+    """判断目标文件是否需要重新复制
+
+    目标不存在或大小不同时直接返回 True，大小相同时再比较内容哈希。
+
+    Args:
+        src: 源文件路径
+        dst: 目标文件路径
+
+    Returns:
+        需要复制时返回 True
+    """
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=str(project_root),
-            check=True,
-            capture_output=False,
-        )
-        print("  ✓ 构建成功")
+        if os.stat(dst).st_size != os.stat(src).st_size:
+            return True
+    except FileNotFoundError:
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"  ✗ 构建失败: {e}")
-        return False
+    return _file_hash(src) != _file_hash(dst)
 
 
-def create_installer_script():
-    """创建简单的安装脚本 (NSIS)"""
-    print("\n生成 NSIS 安装脚本...")
+def _pyinstaller_cache_dir(project_root: Path, spec_file: Path) -> Path:
+    """获取 PyInstaller 缓存目录，并清理过期的缓存
 
-    project_root = Path(__file__).parent
-    exe_path = project_root / "dist" / "DocuRuleFix.exe"
+    缓存目录以 spec 文件和 requirements.txt 的内容哈希命名，
+    依赖或打包配置变化时自动使用新的目录。
 
-    if not exe_path.exists():
-        print("  ✗ 可执行文件不存在，跳过安装脚本生成")
-        return False
+    Args:
+        project_root: 项目根目录
+        spec_file: PyInstaller spec 文件
 
-    nsis_script = f"""; DocuRuleFix 安装脚本
-; 需要安装 NSIS: https://nsis.sourceforge.io/
+    Returns:
+        缓存目录路径
+    """
+    digest = hashlib.blake2b(spec_file.read_bytes())
+    requirements = project_root / "requirements.txt"
+    if requirements.exists():
+        digest.update(requirements.read_bytes())
+    key = digest.hexdigest()[:16]
 
-!define APP_NAME "DocuRuleFix"
-!define APP_VERSION "1.0.0"
-!define APP_PUBLISHER "DocuRuleFix"
-!define APP_EXE "DocuRuleFix.exe"
+    cache_root = project_root / ".pyi-cache"
+    cache_dir = cache_root / key
 
-; 现代 UI
-!include "MUI2.nsh"
+    # 清理超过保留天数的旧缓存
+    if cache_root.exists():
+        cutoff = time.time() - CACHE_MAX_AGE_DAYS * 86400
+        for entry in os.scandir(cache_root):
+            if (entry.is_dir() and entry.name != key
+                    and entry.stat().st_mtime < cutoff):
+                print(f"  删除过期缓存: {entry.path}")
+                _fast_rmtree(entry.path)
 
-; general
-Name "${{APP_NAME}}"
-OutFile "Dist/${{APP_NAME}}-Setup-${{APP_VERSION}}.exe"
-InstallDir "$PROGRAMFILES\\${{APP_NAME}}"
-InstallDirRegKey HKCU "Software\\${{APP_NAME}}" ""
-RequestExecutionLevel admin
+    return cache_dir
 
-; variables
-Var StartMenuFolder
 
-; interface settings
-!define MUI_ABORTWARNING
-!define MUI_ICON "src\\\\resources\\\\icons\\\\DocuRuleFix.ico"
-!define MUI_UNICON "src\\\\resources\\\\icons\\\\DocuRuleFix.ico"
+def build_executable(isolated_cache: bool = False, clean: bool = False):
+    """构建可执行文件
 
-; pages
-!insertmacro MUI_PAGE_WELCOME
-!insertmacro MUI_PAGE_LICENSE "LICENSE"
-!insertmacro MUI_PAGE_COMPONENTS
-!insertmacro MUI_PAGE_DIRECTORY
-!insertmacro MUI_PAGE_STARTMENU Application $StartMenuFolder
-!insertmacro MUI_PAGE_INSTFILES
-!insertmacro MUI_PAGE_FINISH
+    Args:
+        isolated_cache: 是否为本次构建使用独立的临时 PYINSTALLER_CONFIG_DIR，
+                        避免同一台机器上并行运行的多个构建互相破坏缓存；
+                        该目录在构建结束后删除
+        clean: 是否传入 --clean 让 PyInstaller 清空缓存后重建
+    """
+    print("\n开始构建...")
 
-!insertmacro MUI_UNPAGE_WELCOME
-!insertmacro MUI_UNPAGE_CONFIRM
-!insertmacro MUI_UNPAGE_INSTFILES
-!insertmacro MUI_UNPAGE_FINISH
+    project_root = _PROJECT_ROOT
+    spec_file = project_root / "DocuRuleFix.spec"
 
-; languages
-!insertmacro MUI_LANGUAGE "SimpChinese"
-!insertmacro MUI_LANGUAGE "English"
+    if not spec_file.exists():
+        print(f"  ✗ 配置文件不存在: {spec_file}")
+        return False
 
-; installer sections
-Section "主程序" SecMain
-    SectionIn RO
+    # PyInstaller 命令
+    cmd = [sys.executable, "-m", "PyInstaller"]
+    if clean:
+        cmd.append("--clean")
+    cmd.append(str(spec_file))
 
-    SetOutPath "$INSTDIR"
-    File "dist\\${{APP_EXE}}"
+    print(f"  执行命令: {' '.join(cmd)}")
 
-    ; 创建开始菜单快捷方式
-    CreateDirectory "$SMPROGRAMS\\$StartMenuFolder"
-    CreateShortcut "$SMPROGRAMS\\$StartMenuFolder\\${{APP_NAME}}.lnk" \\
-        "$INSTDIR\\${{APP_EXE}}" "" \\
-        "$INSTDIR\\${{APP_EXE}}" 0
+    if isolated_cache:
+        config_dir = Path(tempfile.mkdtemp(prefix="pyi-"))
+    else:
+        config_dir = _pyinstaller_cache_dir(project_root, spec_file)
+    print(f"  PyInstaller 缓存目录: {config_dir}")
 
-    ; 创建桌面快捷方式
-    CreateShortcut "$DESKTOP\\${{APP_NAME}}.lnk" \\
-        "$INSTDIR\\${{APP_EXE}}" "" \\
-        "$INSTDIR\\${{APP_EXE}}" 0
+    try:
+        returncode, info_count = _run_pyinstaller(cmd, project_root, config_dir)
+    finally:
+        # 独立缓存目录只供本次构建使用，结束后（包括失败时）删除
+        if isolated_cache:
+            _fast_rmtree(config_dir)
+
+    print(f"  PyInstaller 输出 {info_count} 条 INFO 日志")
+    if returncode != 0:
+        print(f"  ✗ 构建失败: PyInstaller 退出码 {returncode}")
+        return False
 
-    ; 写入注册表
-    WriteRegStr HKCU "Software\\${{APP_NAME}}" "" $INSTDIR
-    WriteRegStr HKCU "Software\\${{APP_NAME}}" "version" "${{APP_VERSION}}"
+    print("  ✓ 构建成功")
+    return True
 
-    ; 写入卸载信息
-    WriteUninstaller "$INSTDIR\\uninstall.exe"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${{APP_NAME}}" \\
-        "DisplayName" "${{APP_NAME}}"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${{APP_NAME}}" \\
-        "UninstallString" "$INSTDIR\\uninstall.exe"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${{APP_NAME}}" \\
-        "Publisher" "${{APP_PUBLISHER}}"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${{APP_NAME}}" \\
-        "DisplayVersion" "${{APP_VERSION}}"
-    WriteRegDWORD HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${{APP_NAME}}" \\
-        "NoModify" 1
-    WriteRegDWORD HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${{APP_NAME}}" \\
-        "NoRepair" 1
-SectionEnd
 
-; uninstaller section
-Section "Uninstall"
-    Delete "$INSTDIR\\${{APP_EXE}}"
-    Delete "$INSTDIR\\uninstall.exe"
-    Delete "$SMPROGRAMS\\$StartMenuFolder\\${{APP_NAME}}.lnk"
-    Delete "$DESKTOP\\${{APP_NAME}}.lnk"
-    RMDir "$SMPROGRAMS\\$StartMenuFolder"
-    RMDir "$INSTDIR"
+def _run_pyinstaller(cmd: list, project_root: Path, config_dir: Path):
+    """运行 PyInstaller 并精简输出
+
+    Args:
+        cmd: PyInstaller 命令
+        project_root: 项目根目录（工作目录）
+        config_dir: PYINSTALLER_CONFIG_DIR
+
+    Returns:
+        (退出码, INFO 日志条数)
+    """
+    env = {**os.environ, 'PYINSTALLER_CONFIG_DIR': str(config_dir)}
+
+    # 流式读取 PyInstaller 输出：INFO 只显示阶段切换，其余级别原样输出
+    info_count = 0
+    proc = subprocess.Popen(
+        cmd,
+        cwd=str(project_root),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        bufsize=1,
+    )
+    with proc.stdout:
+        for line in proc.stdout:
+            line = line.rstrip()
+            match = PYINSTALLER_LOG_RE.match(line)
+            if match and match.group(1) == "INFO":
+                info_count += 1
+                message = match.group(2)
+                if message.startswith(PYINSTALLER_PHASE_PREFIXES):
+                    print(f"  > {message}")
+            elif line:
+                print(f"    {line}")
+    return proc.wait(), info_count
 
-    DeleteRegKey HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${{APP_NAME}}"
-    DeleteRegKey HKCU "Software\\${{APP_NAME}}"
-SectionEnd
-"""
+
+def create_installer_script():
+    """创建简单的安装脚本 (NSIS)"""
+    print("\n生成 NSIS 安装脚本...")
+
+    project_root = _PROJECT_ROOT
+    exe_path = _DIST_DIR / "DocuRuleFix.exe"
+
+    if not exe_path.exists():
+        print("  ✗ 可执行文件不存在，跳过安装脚本生成")
+        return False
 
     nsis_file = project_root / "installer.nsi"
-    nsis_file.write_text(nsis_script, encoding="utf-8")
+    nsis_file.write_bytes(_NSIS_SCRIPT)
 
     print(f"  ✓ 安装脚本已生成: {nsis_file}")
     print("\n  要创建安装程序，请:")
@@ -226,8 +445,7 @@ def create_portable_package():
     """创建便携版压缩包"""
     print("\n创建便携版...")
 
-    project_root = Path(__file__).parent
-    dist_dir = project_root / "dist"
+    dist_dir = _DIST_DIR
     portable_dir = dist_dir / "DocuRuleFix-Portable"
 
     # 创建便携版目录
@@ -236,9 +454,17 @@ def create_portable_package():
     # 复制可执行文件
     exe_src = dist_dir / "DocuRuleFix.exe"
     exe_dst = portable_dir / "DocuRuleFix.exe"
-    if exe_src.exists():
-        shutil.copy2(exe_src, exe_dst)
-        print(f"  ✓ 复制: DocuRuleFix.exe")
+    try:
+        if _need_copy(exe_src, exe_dst):
+            # 先复制到临时文件再替换，避免留下不完整的可执行文件
+            tmp_dst = exe_dst.with_name(exe_dst.name + ".tmp")
+            _fast_copy(exe_src, tmp_dst)
+            os.replace(tmp_dst, exe_dst)
+            print(f"  ✓ 复制: DocuRuleFix.exe")
+        else:
+            print(f"  ✓ 未变化，跳过复制: DocuRuleFix.exe")
+    except FileNotFoundError:
+        pass
 
     # 创建启动脚本
     start_bat = portable_dir / "启动 DocuRuleFix.bat"
@@ -276,6 +502,9 @@ def main():
     print("DocuRuleFix Windows 构建脚本")
     print("=" * 60)
 
+    isolated_cache = "--isolated-cache" in sys.argv[1:]
+    clean = "--clean" in sys.argv[1:]
+
     # 检查依赖
     if not check_dependencies():
         return 1
@@ -288,7 +517,7 @@ def main():
     clean_build()
 
     # 构建
-    if not build_executable():
+    if not build_executable(isolated_cache=isolated_cache, clean=clean):
         return 1
 
     # 创建安装脚本
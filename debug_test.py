@@ -10,6 +10,46 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from docx import Document
 from rules.structure_rules import ThreeLineGroupValidationRule
 from loguru import logger
+from lxml import etree
+
+# 图片尺寸和名称所在的元素（预编译 XPath，按段落一次遍历元素树）
+_WP_NS = 'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing'
+_W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_EXTENT_TAG = f'{{{_WP_NS}}}extent'
+_RUN_TAG = f'{{{_W_NS}}}r'
+_IMAGE_INFO_XPATH = etree.XPath(
+    './w:r//wp:extent | ./w:r//wp:docPr',
+    namespaces={'wp': _WP_NS, 'w': _W_NS}
+)
+
+
+def log_image_runs(paragraph):
+    """输出段落中每个图片 run 的名称和尺寸
+
+    Args:
+        paragraph: 段落对象
+    """
+    p_element = paragraph._element
+    run_index = {r: i for i, r in enumerate(p_element.iterchildren(_RUN_TAG))}
+
+    # 按 run 收集第一个 extent 和 docPr（结果按文档顺序返回）
+    images = {}
+    for el in _IMAGE_INFO_XPATH(p_element):
+        # 向上找到段落的直接子 run（文本框中可能嵌套 w:r）
+        run = el.getparent()
+        while run.getparent() is not p_element:
+            run = run.getparent()
+        info = images.setdefault(run_index[run], [None, None])
+        slot = 0 if el.tag == _EXTENT_TAG else 1
+        if info[slot] is None:
+            info[slot] = el
+
+    for i, (extent, doc_pr) in images.items():
+        width = extent.get('cx') if extent is not None else "N/A"
+        height = extent.get('cy') if extent is not None else "N/A"
+        name = doc_pr.get('name') if doc_pr is not None else "N/A"
+        logger.info(f"  Run {i}: {name}, 尺寸: {width}x{height}")
+
 
 # 配置 logger
 logger.remove()
@@ -36,17 +76,7 @@ try:
     para = doc.paragraphs[12]  # 索引12是第13行
     logger.info(f"Run 数量: {len(para.runs)}")
 
-    for i, run in enumerate(para.runs):
-        run_xml = run._element.xml
-        # 提取图片信息
-        import re
-        extent_match = re.search(r'<wp:extent\s+cx="(\d+)"\s+cy="(\d+)"', run_xml)
-        name_match = re.search(r'<wp:docPr\s+id="[^"]*"\s+name="([^"]*)"', run_xml)
-        if extent_match or name_match:
-            width = extent_match.group(1) if extent_match else "N/A"
-            height = extent_match.group(2) if extent_match else "N/A"
-            name = name_match.group(1) if name_match else "N/A"
-            logger.info(f"  Run {i}: {name}, 尺寸: {width}x{height}")
+    log_image_runs(para)
 
     # 修复
     logger.info("\n===== 开始修复 =====")
@@ -58,26 +88,16 @@ try:
     para_fixed = fixed_doc.paragraphs[12]
     logger.info(f"Run 数量: {len(para_fixed.runs)}")
 
-    for i, run in enumerate(para_fixed.runs):
-        run_xml = run._element.xml
-        import re
-        extent_match = re.search(r'<wp:extent\s+cx="(\d+)"\s+cy="(\d+)"', run_xml)
-        name_match = re.search(r'<wp:docPr\s+id="[^"]*"\s+name="([^"]*)"', run_xml)
-        if extent_match or name_match:
-            width = extent_match.group(1) if extent_match else "N/A"
-            height = extent_match.group(2) if extent_match else "N/A"
-            name = name_match.group(1) if name_match else "N/A"
-            logger.info(f"  Run {i}: {name}, 尺寸: {width}x{height}")
+    log_image_runs(para_fixed)
 
     # 保存
     fixed_doc.save("/Users/jingjianan/workspace/project/jjn/DocuRuleFix/tests/1_fixed_debug.docx")
     logger.info("\n已保存到 tests/1_fixed_debug.docx")
 
-    # 重新加载检查
+    # 重新加载检查（只有这里需要重新解析文件，规则实例 validate 时会清空错误，可直接复用）
     logger.info("\n===== 重新加载修复后的文件检查 =====")
     doc2 = Document("/Users/jingjianan/workspace/project/jjn/DocuRuleFix/tests/1_fixed_debug.docx")
-    rule2 = ThreeLineGroupValidationRule(title_mode="2", enabled=True)
-    errors2 = rule2.validate(doc2)
+    errors2 = rule.validate(doc2)
     logger.info(f"重新校验发现 {len(errors2)} 个错误")
 
     for error in errors2:
@@ -89,16 +109,7 @@ try:
     para_reload = doc2.paragraphs[12]
     logger.info(f"Run 数量: {len(para_reload.runs)}")
 
-    for i, run in enumerate(para_reload.runs):
-        run_xml = run._element.xml
-        import re
-        extent_match = re.search(r'<wp:extent\s+cx="(\d+)"\s+cy="(\d+)"', run_xml)
-        name_match = re.search(r'<wp:docPr\s+id="[^"]*"\s+name="([^"]*)"', run_xml)
-        if extent_match or name_match:
-            width = extent_match.group(1) if extent_match else "N/A"
-            height = extent_match.group(2) if extent_match else "N/A"
-            name = name_match.group(1) if name_match else "N/A"
-            logger.info(f"  Run {i}: {name}, 尺寸: {width}x{height}")
+    log_image_runs(para_reload)
 
 except Exception as e:
     logger.error(f"错误: {type(e).__name__}: {e}")
@@ -8,6 +8,12 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from docx import Document
+from lxml import etree
+
+# 图片相关元素（预编译 XPath，直接遍历元素树）
+_WP_NAMESPACES = {'wp': 'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing'}
+_EXTENT_CY_XPATH = etree.XPath('.//wp:extent/@cy', namespaces=_WP_NAMESPACES)
+_DOCPR_NAME_XPATH = etree.XPath(".//wp:docPr/@name[. != '']", namespaces=_WP_NAMESPACES)
 
 try:
     # 加载文档
@@ -31,19 +37,17 @@ try:
     print(f"  XML 长度: {len(xml_str)}")
     print()
 
-    # 查找所有包含 graphic 或 pic 的行
+    # 查找图片相关元素
     print("  查找图片相关元素:")
-    if 'drawing' in xml_str or 'graphic' in xml_str or 'pic:' in xml_str:
-        import re
-
+    extents = _EXTENT_CY_XPATH(p_element)
+    docPrs = _DOCPR_NAME_XPATH(p_element)
+    if extents or docPrs:
         # 查找 extent
-        extents = re.findall(r'<wp:extent[^>]*cy=["\'](\d+)["\'][^>]*>', xml_str)
         print(f"  找到 {len(extents)} 个 extent:")
         for i, cy in enumerate(extents):
             print(f"    extent[{i}]: cy={cy}")
 
         # 查找 docPr
-        docPrs = re.findall(r'<wp:docPr[^>]*name=["\']([^"\']+)["\'][^>]*>', xml_str)
         print(f"  找到 {len(docPrs)} 个 docPr:")
         for i, name in enumerate(docPrs):
             print(f"    docPr[{i}]: name={name}")
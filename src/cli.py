@@ -0,0 +1,301 @@
+"""命令行入口模块
+
+实现 main.py 的命令行处理逻辑
+"""
+
+import os
+import sys
+import argparse
+from typing import List
+
+# 控制台日志格式（终端 / 重定向）
+CONSOLE_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>"
+PLAIN_CONSOLE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}"
+
+# --mode 可选值到标题模式的映射
+TITLE_MODES = {
+    "standard": "1",
+    "1": "1",
+    "simple": "2",
+    "2": "2",
+}
+
+
+def print_usage():
+    """打印使用说明"""
+    print("\n" + "="*50)
+    print("DocuRuleFix - Word 文档处理工具")
+    print("="*50)
+    print("\n使用方法:")
+    print("  python main.py <文件路径>                          # 校验文档（标准模式）")
+    print("  python main.py <文件路径> --mode=simple            # 使用精简模式校验")
+    print("  python main.py <文件路径> --mode=standard          # 使用标准模式校验")
+    print("  python main.py <文件路径> --fix                    # 校验并修复文档")
+    print("  python main.py <文件路径> --skip-corrupted         # 跳过损坏的文档")
+    print("  python main.py <文件1> <文件2> ... --fix           # 多进程批量修复多个文档")
+    print("\n模式说明:")
+    print("  --mode=standard (或 --mode=1)")
+    print("      标准模式：标题必须包含 . _ ： 三个字符")
+    print("      格式：序号.舆论场_来源：标题内容")
+    print()
+    print("  --mode=simple (或 --mode=2)")
+    print("      精简模式：标题只需 序号.内容 格式")
+    print("      格式：序号.标题内容")
+    print("\n示例代码:")
+    print("-" * 50)
+
+    # 创建示例代码供测试
+    code_example = '''
+# 创建文档处理器
+processor = DocumentProcessor(rule_engine, create_backup=True)
+
+# 仅校验文档
+result = processor.validate_only("test.docx")
+print(f"校验结果: {result.message}")
+
+# 处理文档（带修复）
+result = processor.process("test.docx", fix_errors=True)
+print(f"处理结果: {result.message}")
+
+# 跳过损坏的文档
+try:
+    result = processor.validate_only("test.docx", skip_corrupted=True)
+except CorruptedDocumentError as e:
+    print(f"跳过损坏的文档: {e.file_path}")
+'''
+
+    print(code_example)
+    print("-" * 50)
+
+
+def print_hints():
+    """打印命令行提示"""
+    print("\n提示: 使用 `python main.py <文件路径>` 来处理文档")
+    print("      使用 `python main.py <文件路径> --mode=simple` 使用精简模式")
+    print("      使用 `python main.py <文件路径> --fix` 来修复文档")
+    print("      使用 `python main.py <文件路径> --skip-corrupted` 来跳过损坏文档")
+    print("      使用 `python main.py <文件1> <文件2> ...` 来批量处理多个文档")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """创建命令行参数解析器
+
+    Returns:
+        参数解析器
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="DocuRuleFix - Word 文档处理工具"
+    )
+    parser.add_argument("file_paths", nargs="*", metavar="file_path",
+                        help="要处理的 Word 文档路径，可指定多个")
+    parser.add_argument(
+        "--mode",
+        choices=list(TITLE_MODES),
+        default="standard",
+        help="标题模式：standard(1) 标准模式，simple(2) 精简模式"
+    )
+    parser.add_argument("--fix", action="store_true", help="校验并修复文档")
+    parser.add_argument("--skip-corrupted", action="store_true", help="跳过损坏的文档")
+    return parser
+
+
+def run(argv: List[str]) -> int:
+    """运行命令行入口
+
+    Args:
+        argv: 命令行参数（argv[0] 为程序名）
+
+    Returns:
+        进程退出码
+    """
+    # 解析命令行参数
+    args = build_parser().parse_args(argv[1:])
+
+    # 未提供文件路径时只打印说明，不加载日志和文档处理模块
+    if not args.file_paths:
+        print_usage()
+        print_hints()
+        return 0
+
+    # 重要：在导入任何使用 python-docx 的模块之前，先应用补丁
+    from utils.docx_patch import apply_patch
+    apply_patch()
+
+    from loguru import logger
+    from core.rule_engine import RuleEngine
+    from core.document_processor import DocumentProcessor, CorruptedDocumentError
+    from rules.structure_rules import ThreeLineGroupValidationRule
+
+    # 配置日志
+    logger.remove()  # 移除默认处理器
+
+    # 输出被重定向时使用不带颜色标记的格式
+    is_tty = sys.stdout.isatty()
+    logger.add(
+        sys.stdout,
+        format=CONSOLE_FORMAT if is_tty else PLAIN_CONSOLE_FORMAT,
+        colorize=is_tty,
+        level="INFO"
+    )
+    # 文件日志通过后台队列批量写入，不阻塞文档处理
+    logger.add(
+        "logs/docurulefix_{time:YYYY-MM-DD}.log",
+        rotation="10 MB",
+        retention="7 days",
+        level="DEBUG",
+        encoding="utf-8",
+        enqueue=True,
+        buffering=65536
+    )
+
+    logger.info("DocuRuleFix 启动")
+
+    title_mode = TITLE_MODES[args.mode]
+    skip_corrupted = args.skip_corrupted
+    fix_mode = args.fix
+
+    # 创建规则引擎
+    rule_engine = RuleEngine()
+
+    # 注册三行一组结构校验规则（使用指定的模式）
+    structure_rule = ThreeLineGroupValidationRule(title_mode=title_mode, enabled=True)
+    rule_engine.register_rule(structure_rule)
+
+    mode_name = "精简模式" if title_mode == "2" else "标准模式"
+    logger.info(f"使用模式: {mode_name}")
+    logger.info(f"已注册 {rule_engine.get_rule_count()} 个规则")
+    logger.info(f"已启用 {rule_engine.get_enabled_rule_count()} 个规则")
+
+    # 指定多个文件时批量处理
+    if len(args.file_paths) > 1:
+        rule_configs = [{'type': 'structure_validation', 'config': {'title_mode': title_mode}}]
+        exit_code = run_batch(args.file_paths, rule_engine, rule_configs, fix_mode, skip_corrupted)
+        logger.info("DocuRuleFix 退出")
+        logger.complete()
+        return exit_code
+
+    # 处理文件
+    exit_code = 0
+    file_path = args.file_paths[0]
+    if os.path.exists(file_path):
+        logger.info(f"处理文件: {file_path}")
+
+        processor = DocumentProcessor(rule_engine, create_backup=True)
+
+        try:
+            # 先校验
+            result = processor.validate_only(file_path, skip_corrupted=skip_corrupted)
+            print(f"\n校验结果: {result.message}")
+
+            # 显示错误详情
+            errors = rule_engine.get_all_errors()
+            if errors:
+                print(f"\n发现 {len(errors)} 个问题:")
+                for error in errors[:10]:  # 只显示前10个
+                    print(f"  [{error.line_type}] 行{error.line_index + 1}: {error.message}")
+                if len(errors) > 10:
+                    print(f"  ... 还有 {len(errors) - 10} 个问题")
+
+                # 询问是否修复
+                if fix_mode:
+                    print("\n正在修复...")
+
+                    # 生成输出文件名：添加 _fixed 后缀
+                    from pathlib import Path
+                    path_obj = Path(file_path)
+                    fixed_path = str(path_obj.parent / f"{path_obj.stem}_fixed{path_obj.suffix}")
+
+                    result = processor.process(file_path, output_path=fixed_path, fix_errors=True, skip_corrupted=skip_corrupted)
+                    print(f"修复结果: {result.message}")
+                    print(f"修复后的文件: {fixed_path}")
+
+                    # 再次校验修复后的文件
+                    print("\n正在校验修复后的文件...")
+                    result = processor.validate_only(fixed_path, skip_corrupted=skip_corrupted)
+                    print(f"修复后校验: {result.message}")
+
+                    # 显示修复后剩余的错误
+                    errors_after = rule_engine.get_all_errors()
+                    if errors_after:
+                        print(f"\n修复后仍存在 {len(errors_after)} 个问题:")
+                        for error in errors_after[:10]:
+                            print(f"  [{error.line_type}] 行{error.line_index + 1}: {error.message}")
+                        if len(errors_after) > 10:
+                            print(f"  ... 还有 {len(errors_after) - 10} 个问题")
+                    else:
+                        print("\n修复完成，文档结构已正确！")
+            else:
+                print("\n文档结构完全正确！")
+
+        except CorruptedDocumentError as e:
+            print(f"\n跳过损坏的文档: {e.file_path}")
+            print(f"原因: {e.original_error}")
+            logger.warning(f"文档损坏已跳过: {file_path}")
+
+    else:
+        logger.error(f"文件不存在: {file_path}")
+        exit_code = 1
+
+    logger.info("DocuRuleFix 退出")
+
+    # 等待队列中的日志写入完成
+    logger.complete()
+    return exit_code
+
+
+def run_batch(file_paths: List[str], rule_engine, rule_configs: List[dict],
+              fix_mode: bool, skip_corrupted: bool) -> int:
+    """批量处理多个文档
+
+    修复模式下通过 DocumentProcessor.process_many 在多个进程中并行修复，
+    修复结果写入带 _fixed 后缀的新文件；否则在当前进程中逐个校验。
+
+    Args:
+        file_paths: 文档路径列表
+        rule_engine: 规则引擎（逐个校验时使用）
+        rule_configs: 规则配置列表（工作进程据此创建规则）
+        fix_mode: 是否修复
+        skip_corrupted: 是否跳过损坏的文档
+
+    Returns:
+        进程退出码，有文件不存在时为 1
+    """
+    from loguru import logger
+    from core.document_processor import DocumentProcessor, CorruptedDocumentError
+
+    exit_code = 0
+    existing_paths = []
+    for file_path in file_paths:
+        if os.path.exists(file_path):
+            existing_paths.append(file_path)
+        else:
+            logger.error(f"文件不存在: {file_path}")
+            exit_code = 1
+
+    if not existing_paths:
+        return exit_code
+
+    if fix_mode:
+        print(f"\n正在批量修复 {len(existing_paths)} 个文档...")
+        results = DocumentProcessor.process_many(
+            existing_paths, rule_configs, fix_errors=True, output_suffix="_fixed"
+        )
+        for result in results:
+            if result.success:
+                print(f"  {result.input_path}: {result.message}，输出: {result.output_path}")
+            else:
+                print(f"  {result.input_path}: {result.message}")
+        return exit_code
+
+    print(f"\n正在校验 {len(existing_paths)} 个文档...")
+    processor = DocumentProcessor(rule_engine, create_backup=False)
+    for file_path in existing_paths:
+        try:
+            result = processor.validate_only(file_path, skip_corrupted=skip_corrupted)
+            print(f"  {file_path}: {result.message}")
+        except CorruptedDocumentError as e:
+            print(f"  {file_path}: 跳过损坏的文档，原因: {e.original_error}")
+            logger.warning(f"文档损坏已跳过: {file_path}")
+
+    return exit_code
@@ -3,15 +3,30 @@
 负责单个文档的处理、保存和备份
 """
 
+import io
 import os
+import time
 import shutil
+import itertools
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any
-from datetime import datetime
+from typing import Optional, Callable, Dict, Any, List, Tuple
+from datetime import datetime, timedelta
 from docx import Document
 from loguru import logger
 
-from core.rule_engine import RuleEngine
+from core.rule_engine import RuleEngine, RuleFactory
+
+# 已解析文档的缓存数量（校验后再处理同一文件时复用）
+DOCUMENT_CACHE_SIZE = 8
+
+# 备份复制的缓冲区大小和后台线程数
+BACKUP_BUFSIZE = 1024 * 1024
+BACKUP_WORKERS = 4
+
+# 批量处理的工作进程数，未设置时使用 CPU 核数 - 1
+BATCH_WORKERS_ENV = "DOCURULEFIX_BATCH_WORKERS"
 
 
 class CorruptedDocumentError(Exception):
@@ -27,7 +42,14 @@ class CorruptedDocumentError(Exception):
 
 
 class ProcessingResult:
-    """处理结果"""
+    """处理结果
+
+    时间戳以整数纳秒保存，只在需要时转换为 datetime；to_dict 的结果会被缓存，
+    结果对象创建后不应再修改
+    """
+
+    __slots__ = ('success', 'input_path', 'output_path', 'errors_count',
+                 'message', '_timestamp_ns', '_cached_dict')
 
     def __init__(self, success: bool, input_path: str, output_path: str,
                  errors_count: int = 0, message: str = ""):
@@ -36,18 +58,105 @@ class ProcessingResult:
         self.output_path = output_path
         self.errors_count = errors_count
         self.message = message
-        self.timestamp = datetime.now()
+        self._timestamp_ns = time.time_ns()
+        self._cached_dict: Optional[Dict[str, Any]] = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """处理完成的时间"""
+        seconds, nanos = divmod(self._timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds) + timedelta(microseconds=nanos // 1000)
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
-        return {
-            "success": self.success,
-            "input_path": self.input_path,
-            "output_path": self.output_path,
-            "errors_count": self.errors_count,
-            "message": self.message,
-            "timestamp": self.timestamp.isoformat()
-        }
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "success": self.success,
+                "input_path": self.input_path,
+                "output_path": self.output_path,
+                "errors_count": self.errors_count,
+                "message": self.message,
+                "timestamp": self.timestamp.isoformat()
+            }
+        return self._cached_dict
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """以 1 MiB 缓冲区复制文件，并保留访问权限和修改时间
+
+    Args:
+        src: 源文件路径
+        dst: 目标文件路径
+    """
+    with open(src, 'rb', buffering=0) as reader, open(dst, 'wb', buffering=0) as writer:
+        while chunk := reader.read(BACKUP_BUFSIZE):
+            writer.write(chunk)
+    shutil.copystat(src, dst)
+
+
+def _default_batch_workers() -> int:
+    """获取批量处理的默认工作进程数
+
+    Returns:
+        工作进程数
+    """
+    value = os.environ.get(BATCH_WORKERS_ENV)
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            logger.warning(f"环境变量 {BATCH_WORKERS_ENV} 无效: {value}")
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+# 工作进程内复用的文档处理器和修复模式，由 _init_batch_worker 创建
+_worker_processor: Optional["DocumentProcessor"] = None
+_worker_fix_errors = False
+
+
+def _init_batch_worker(rule_configs: List[Dict[str, Any]], fix_errors: bool,
+                       create_backup: bool) -> None:
+    """工作进程初始化：应用 python-docx 补丁，并创建本进程处理所有文档共用的处理器
+
+    规则引擎不能跨进程传递，根据规则配置在每个工作进程内创建一次。
+
+    Args:
+        rule_configs: 规则配置列表
+        fix_errors: 是否自动修复错误
+        create_backup: 是否创建备份
+    """
+    global _worker_processor, _worker_fix_errors
+    from utils.docx_patch import apply_patch
+    apply_patch()
+
+    rule_engine = RuleEngine()
+    for rule in RuleFactory.create_rules_from_config(rule_configs):
+        rule_engine.register_rule(rule)
+
+    _worker_processor = DocumentProcessor(rule_engine, create_backup=create_backup)
+    _worker_fix_errors = fix_errors
+
+
+def _process_worker(job: Tuple[str, Optional[str]]) -> "ProcessingResult":
+    """在工作进程中处理单个文档
+
+    Args:
+        job: (输入路径, 输出路径)
+
+    Returns:
+        处理结果对象，损坏的文档返回失败结果
+    """
+    input_path, output_path = job
+    try:
+        return _worker_processor.process(input_path, output_path=output_path,
+                                         fix_errors=_worker_fix_errors, skip_corrupted=True)
+    except CorruptedDocumentError as e:
+        return ProcessingResult(
+            success=False,
+            input_path=input_path,
+            output_path=output_path or input_path,
+            message=f"跳过损坏的文档: {e.original_error}"
+        )
 
 
 class DocumentProcessor:
@@ -66,6 +175,12 @@ class DocumentProcessor:
         self.rule_engine = rule_engine
         self.create_backup = create_backup
         self.backup_dir: Optional[str] = None
+        # (绝对路径, 修改时间, 文件大小) -> 已解析的文档
+        self._document_cache: "OrderedDict[tuple, Document]" = OrderedDict()
+        # 后台备份线程池（首次备份时创建）
+        self._backup_pool: Optional[ThreadPoolExecutor] = None
+        # 备份文件名的序号，避免同一秒内的备份重名
+        self._backup_seq = itertools.count()
 
     def set_backup_dir(self, backup_dir: str) -> None:
         """设置备份目录
@@ -95,8 +210,10 @@ class DocumentProcessor:
             CorruptedDocumentError: 当skip_corrupted=True且文档损坏时
         """
         try:
-            # 验证输入文件
-            if not os.path.exists(input_path):
+            # 验证输入文件（stat 结果同时用于文档缓存）
+            try:
+                st = os.stat(input_path)
+            except FileNotFoundError:
                 return ProcessingResult(
                     success=False,
                     input_path=input_path,
@@ -104,15 +221,15 @@ class DocumentProcessor:
                     message=f"输入文件不存在: {input_path}"
                 )
 
-            logger.info(f"开始处理文档: {input_path}")
+            logger.info("开始处理文档: {}", input_path)
 
-            # 加载文档
-            document = Document(input_path)
+            # 加载文档（处理会修改文档，从缓存中取出后不再放回）
+            document = self._load_document(input_path, st, reuse=False)
 
-            # 创建备份（如果需要且是覆盖模式）
+            # 创建备份（如果需要且是覆盖模式），备份在后台复制，与规则执行并行
+            backup_future = None
             if output_path is None and self.create_backup:
-                backup_path = self._create_backup(input_path)
-                logger.info(f"创建备份: {backup_path}")
+                backup_path, backup_future = self._submit_backup(input_path)
 
             # 如果是修复模式，先校验获取原始错误数量
             if fix_errors:
@@ -120,8 +237,8 @@ class DocumentProcessor:
                 original_errors = self.rule_engine.validate(document)
                 errors_count = len(original_errors)
 
-                # 再执行修复
-                document = self.rule_engine.execute_rules(document, fix_errors=True)
+                # 再执行修复（复用刚得到的校验结果，不再重复校验）
+                document = self.rule_engine.execute_rules(document, fix_errors=True, validated=True)
             else:
                 # 普通模式，直接执行规则
                 document = self.rule_engine.execute_rules(document, fix_errors=False)
@@ -139,9 +256,14 @@ class DocumentProcessor:
             if output_dir:
                 os.makedirs(output_dir, exist_ok=True)
 
+            # 覆盖原文件前必须等待备份完成
+            if backup_future is not None:
+                backup_future.result()
+                logger.info("创建备份: {}", backup_path)
+
             # 保存文档
-            document.save(output_path)
-            logger.info(f"文档保存成功: {output_path}")
+            self._save_document(document, output_path)
+            logger.info("文档保存成功: {}", output_path)
 
             # 构建结果消息
             if fix_errors:
@@ -190,6 +312,45 @@ class DocumentProcessor:
                 message=f"处理失败: {str(e)}"
             )
 
+    @classmethod
+    def process_many(cls, input_paths: List[str], rule_configs: List[Dict[str, Any]],
+                     fix_errors: bool = False, output_suffix: Optional[str] = None,
+                     create_backup: bool = True,
+                     max_workers: Optional[int] = None) -> List[ProcessingResult]:
+        """使用多进程批量处理文档
+
+        每个文档在独立的工作进程中处理，损坏的文档以失败结果返回，不会中断批处理。
+
+        Args:
+            input_paths: 输入文档路径列表
+            rule_configs: 规则配置列表，格式同 RuleFactory.create_rules_from_config
+            fix_errors: 是否自动修复错误
+            output_suffix: 输出文件名后缀（如 "_fixed"），为None则覆盖原文件
+            create_backup: 是否创建备份
+            max_workers: 工作进程数，为None则读取环境变量 DOCURULEFIX_BATCH_WORKERS
+
+        Returns:
+            处理结果列表，与输入路径顺序一致
+        """
+        if not input_paths:
+            return []
+
+        jobs = []
+        for input_path in input_paths:
+            output_path = None
+            if output_suffix:
+                path_obj = Path(input_path)
+                output_path = str(path_obj.parent / f"{path_obj.stem}{output_suffix}{path_obj.suffix}")
+            jobs.append((input_path, output_path))
+
+        workers = min(max_workers or _default_batch_workers(), len(jobs))
+        chunksize = max(1, len(jobs) // (workers * 4))
+        logger.info(f"开始批量处理 {len(jobs)} 个文档，工作进程数: {workers}")
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(rule_configs, fix_errors, create_backup)) as pool:
+            return list(pool.map(_process_worker, jobs, chunksize=chunksize))
+
     def validate_only(self, input_path: str, skip_corrupted: bool = False) -> ProcessingResult:
         """仅校验文档不修改
 
@@ -205,7 +366,9 @@ class DocumentProcessor:
             CorruptedDocumentError: 当skip_corrupted=True且文档损坏时
         """
         try:
-            if not os.path.exists(input_path):
+            try:
+                st = os.stat(input_path)
+            except FileNotFoundError:
                 return ProcessingResult(
                     success=False,
                     input_path=input_path,
@@ -213,16 +376,16 @@ class DocumentProcessor:
                     message=f"输入文件不存在: {input_path}"
                 )
 
-            logger.info(f"开始校验文档: {input_path}")
+            logger.info("开始校验文档: {}", input_path)
 
             # 加载文档
-            document = Document(input_path)
+            document = self._load_document(input_path, st, reuse=True)
 
             # 执行校验
             errors = self.rule_engine.validate(document)
             errors_count = len(errors)
 
-            logger.info(f"校验完成，发现 {errors_count} 个问题")
+            logger.info("校验完成，发现 {} 个问题", errors_count)
 
             return ProcessingResult(
                 success=True,
@@ -259,14 +422,55 @@ class DocumentProcessor:
                 message=f"校验失败: {str(e)}"
             )
 
-    def _create_backup(self, file_path: str) -> str:
-        """创建文件备份
+    def _load_document(self, input_path: str, st: os.stat_result, reuse: bool) -> Document:
+        """加载文档，优先使用缓存中已解析的文档
+
+        缓存以文件路径、修改时间和大小为键，文件变化后自动失效。
+
+        Args:
+            input_path: 文档路径
+            st: 文档的 stat 结果
+            reuse: True 表示只读使用，文档保留在缓存中；
+                   False 表示调用者会修改文档，从缓存中取出
+
+        Returns:
+            文档对象
+        """
+        key = (os.path.abspath(input_path), st.st_mtime_ns, st.st_size)
+
+        document = self._document_cache.pop(key, None)
+        if document is None:
+            document = Document(input_path)
+        else:
+            logger.debug("复用已解析的文档: {}", input_path)
+
+        if reuse:
+            self._document_cache[key] = document
+            while len(self._document_cache) > DOCUMENT_CACHE_SIZE:
+                self._document_cache.popitem(last=False)
+
+        return document
+
+    def _save_document(self, document: Document, output_path: str) -> None:
+        """保存文档：先完整写入内存，再一次性写入文件
+
+        Args:
+            document: 文档对象
+            output_path: 输出文件路径
+        """
+        buffer = io.BytesIO()
+        document.save(buffer)
+        with buffer.getbuffer() as data, open(output_path, 'wb') as f:
+            f.write(data)
+
+    def _submit_backup(self, file_path: str) -> Tuple[str, Future]:
+        """提交文件备份任务到后台线程池
 
         Args:
             file_path: 原文件路径
 
         Returns:
-            备份文件路径
+            (备份文件路径, 复制任务的 Future)
         """
         # 确定备份目录
         if self.backup_dir:
@@ -280,13 +484,16 @@ class DocumentProcessor:
         # 生成备份文件名
         file_name = Path(file_path).name
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_name = f"{timestamp}_{file_name}"
+        backup_name = f"{timestamp}_{next(self._backup_seq):04d}_{file_name}"
         backup_path = os.path.join(backup_dir, backup_name)
 
         # 复制文件
-        shutil.copy2(file_path, backup_path)
+        if self._backup_pool is None:
+            self._backup_pool = ThreadPoolExecutor(max_workers=BACKUP_WORKERS,
+                                                   thread_name_prefix="backup")
+        future = self._backup_pool.submit(_copy_file, file_path, backup_path)
 
-        return backup_path
+        return backup_path, future
 
     def get_backup_files(self, file_path: str) -> list[str]:
         """获取指定文件的所有备份
@@ -304,22 +511,20 @@ class DocumentProcessor:
             file_dir = os.path.dirname(file_path)
             backup_dir = os.path.join(file_dir, "backups")
 
-        if not os.path.exists(backup_dir):
-            return []
-
         file_name = Path(file_path).name
 
-        # 查找所有备份文件
-        backups = []
-        for file in os.listdir(backup_dir):
-            if file.endswith(file_name):
-                backup_path = os.path.join(backup_dir, file)
-                backups.append(backup_path)
+        # 查找所有备份文件（DirEntry 自带 stat 结果，无需再逐个 getmtime）
+        try:
+            with os.scandir(backup_dir) as it:
+                entries = [(entry.stat().st_mtime, entry.path)
+                           for entry in it if entry.name.endswith(file_name)]
+        except FileNotFoundError:
+            return []
 
         # 按修改时间倒序排序
-        backups.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+        entries.sort(reverse=True)
 
-        return backups
+        return [path for _, path in entries]
 
     def restore_from_backup(self, file_path: str, backup_path: str) -> bool:
         """从备份恢复文件
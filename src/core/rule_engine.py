@@ -3,6 +3,7 @@
 管理规则的注册、执行和错误处理
 """
 
+import time
 from typing import List, Dict, Any, Optional, Callable
 from docx import Document
 from loguru import logger
@@ -10,6 +11,18 @@ from loguru import logger
 from rules.base_rule import BaseRule, ValidationError
 from rules.structure_rules import ThreeLineGroupValidationRule
 
+# 进度回调的最小间隔（秒），最多每秒 30 次
+PROGRESS_INTERVAL = 1 / 30
+
+
+# 规则类型 -> 构造函数 (config, enabled) -> 规则实例
+_RULE_TABLE: Dict[str, Callable[[Dict[str, Any], bool], BaseRule]] = {
+    'structure_validation': lambda config, enabled: ThreeLineGroupValidationRule(
+        title_mode=config.get('title_mode', '1'),
+        enabled=enabled
+    ),
+}
+
 
 class RuleEngine:
     """规则引擎
@@ -20,7 +33,10 @@ class RuleEngine:
     def __init__(self):
         """初始化规则引擎"""
         self.rules: List[BaseRule] = []
+        # 已启用规则列表缓存，注册/注销/启用/禁用规则时失效
+        self._enabled_cache: Optional[List[BaseRule]] = None
         self.progress_callback: Optional[Callable[[int, int, str], None]] = None
+        self._last_progress_time = 0.0
 
     def register_rule(self, rule: BaseRule) -> None:
         """注册规则
@@ -32,6 +48,7 @@ class RuleEngine:
             raise TypeError(f"规则必须继承自 BaseRule，当前类型: {type(rule)}")
 
         self.rules.append(rule)
+        self._enabled_cache = None
         logger.info(f"注册规则: {rule.name}")
 
     def unregister_rule(self, rule_name: str) -> bool:
@@ -46,6 +63,7 @@ class RuleEngine:
         for i, rule in enumerate(self.rules):
             if rule.name == rule_name:
                 self.rules.pop(i)
+                self._enabled_cache = None
                 logger.info(f"注销规则: {rule_name}")
                 return True
         return False
@@ -75,10 +93,14 @@ class RuleEngine:
     def get_enabled_rules(self) -> List[BaseRule]:
         """获取所有已启用的规则
 
+        结果会被缓存，调用者不应修改返回的列表
+
         Returns:
             已启用的规则列表
         """
-        return [rule for rule in self.rules if rule.is_enabled()]
+        if self._enabled_cache is None:
+            self._enabled_cache = [rule for rule in self.rules if rule.is_enabled()]
+        return self._enabled_cache
 
     def enable_rule(self, rule_name: str) -> bool:
         """启用指定规则
@@ -92,6 +114,7 @@ class RuleEngine:
         rule = self.get_rule(rule_name)
         if rule:
             rule.enable()
+            self._enabled_cache = None
             logger.info(f"启用规则: {rule_name}")
             return True
         return False
@@ -108,6 +131,7 @@ class RuleEngine:
         rule = self.get_rule(rule_name)
         if rule:
             rule.disable()
+            self._enabled_cache = None
             logger.info(f"禁用规则: {rule_name}")
             return True
         return False
@@ -123,9 +147,10 @@ class RuleEngine:
         Returns:
             所有错误列表
         """
-        all_errors = []
+        all_errors: List[ValidationError] = []
+        extend = all_errors.extend
         for rule in self.rules:
-            all_errors.extend(rule.get_errors())
+            extend(rule.errors)
         return all_errors
 
     def get_error_summary(self) -> Dict[str, Dict[str, int]]:
@@ -151,53 +176,73 @@ class RuleEngine:
         """
         self.clear_all_errors()
         enabled_rules = self.get_enabled_rules()
+        if not enabled_rules:
+            return []
 
-        logger.info(f"开始校验文档，共{len(enabled_rules)}个规则")
+        logger.info("开始校验文档，共{}个规则", len(enabled_rules))
 
         for i, rule in enumerate(enabled_rules):
-            if self.progress_callback:
-                self.progress_callback(i + 1, len(enabled_rules), f"执行规则: {rule.name}")
+            self._report_progress(i + 1, len(enabled_rules), rule)
 
             try:
                 rule.validate(document)
-                logger.info(f"规则 {rule.name} 校验完成，发现 {len(rule.get_errors())} 个错误")
+                logger.info("规则 {} 校验完成，发现 {} 个错误", rule.name, len(rule.get_errors()))
             except Exception as e:
                 logger.error(f"规则 {rule.name} 执行失败: {str(e)}")
 
         return self.get_all_errors()
 
-    def execute_rules(self, document: Document, fix_errors: bool = False) -> Document:
+    def execute_rules(self, document: Document, fix_errors: bool = False,
+                      validated: bool = False) -> Document:
         """执行所有已启用的规则
 
         Args:
             document: 要处理的Word文档对象
             fix_errors: 是否自动修复错误
+            validated: 文档刚通过 validate() 校验且未被修改，修复时复用各规则的校验结果
 
         Returns:
             处理后的文档对象
         """
         enabled_rules = self.get_enabled_rules()
+        if not enabled_rules:
+            return document
 
-        logger.info(f"开始执行规则，共{len(enabled_rules)}个规则，修复模式: {fix_errors}")
+        logger.info("开始执行规则，共{}个规则，修复模式: {}", len(enabled_rules), fix_errors)
 
         for i, rule in enumerate(enabled_rules):
-            if self.progress_callback:
-                self.progress_callback(i + 1, len(enabled_rules), f"执行规则: {rule.name}")
+            self._report_progress(i + 1, len(enabled_rules), rule)
 
             try:
                 if fix_errors:
                     # 修复模式
-                    document = rule.fix(document)
+                    document = rule.fix(document, rule.errors if validated else None)
                 else:
                     # 普通应用模式
                     document = rule.apply(document)
 
-                logger.info(f"规则 {rule.name} 执行完成")
+                logger.info("规则 {} 执行完成", rule.name)
             except Exception as e:
                 logger.error(f"规则 {rule.name} 执行失败: {str(e)}")
 
         return document
 
+    def _report_progress(self, current: int, total: int, rule: BaseRule) -> None:
+        """调用进度回调，间隔小于 PROGRESS_INTERVAL 的更新被合并，最后一次总是回调
+
+        Args:
+            current: 当前规则序号（从1开始）
+            total: 规则总数
+            rule: 当前执行的规则
+        """
+        if not self.progress_callback:
+            return
+
+        now = time.monotonic()
+        if current == total or now - self._last_progress_time >= PROGRESS_INTERVAL:
+            self._last_progress_time = now
+            self.progress_callback(current, total, f"执行规则: {rule.name}")
+
     def set_progress_callback(self, callback: Callable[[int, int, str], None]) -> None:
         """设置进度回调函数
 
@@ -246,25 +291,10 @@ class RuleFactory:
         enabled = rule_config.get('enabled', True)
         config = rule_config.get('config', {})
 
-        if rule_type == 'structure_validation':
-            return ThreeLineGroupValidationRule(
-                title_mode=config.get('title_mode', '1'),
-                enabled=enabled
-            )
-        elif rule_type == 'text_replacement':
-            # TODO: 实现文本替换规则
-            raise NotImplementedError(f"规则类型 {rule_type} 尚未实现")
-        elif rule_type == 'format_adjustment':
-            # TODO: 实现格式调整规则
-            raise NotImplementedError(f"规则类型 {rule_type} 尚未实现")
-        elif rule_type == 'content_operation':
-            # TODO: 实现内容操作规则
-            raise NotImplementedError(f"规则类型 {rule_type} 尚未实现")
-        elif rule_type == 'advanced':
-            # TODO: 实现高级规则
-            raise NotImplementedError(f"规则类型 {rule_type} 尚未实现")
-        else:
-            raise ValueError(f"不支持的规则类型: {rule_type}")
+        constructor = _RULE_TABLE.get(rule_type)
+        if constructor is not None:
+            return constructor(config, enabled)
+        raise ValueError(f"不支持的规则类型: {rule_type}")
 
     @staticmethod
     def create_rules_from_config(configs: List[Dict[str, Any]]) -> List[BaseRule]:
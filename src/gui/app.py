@@ -24,16 +24,16 @@ else:
 if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
 
-# 应用补丁（在任何使用 python-docx 的导入之前）
-from utils.docx_patch import apply_patch
-apply_patch()
-
-import customtkinter as ctk
-from gui.main_window import MainWindow
-
 
 def main():
     """主函数"""
+    # 应用补丁（在加载任何文档之前），GUI 模块在 main() 中才导入
+    from utils.docx_patch import apply_patch
+    apply_patch()
+
+    import customtkinter as ctk
+    from gui.main_window import MainWindow
+
     # 设置外观模式
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("blue")
@@ -3,6 +3,7 @@
 提供拖拽支持和文件浏览功能。
 """
 
+import os
 import customtkinter as ctk
 from typing import Callable, Optional
 from pathlib import Path
@@ -10,12 +11,50 @@ import tkinter as tk
 from tkinter import filedialog
 
 
+def _ensure_dnd(root):
+    """为根窗口加载 tkdnd 拖拽支持（每个根窗口成功加载一次）
+
+    Args:
+        root: 根窗口
+
+    Raises:
+        ImportError: 未安装 tkinterdnd2
+    """
+    # 检查根窗口是否已启用 TkinterDnD
+    if getattr(root, '_tkinterDnD_initialized', False):
+        return
+
+    from tkinterdnd2 import TkinterDnD
+
+    try:
+        # 这可能会失败，因为 CustomTkinter 的主窗口已经初始化
+        TkinterDnD.load(root)
+        root._tkinterDnD_initialized = True
+    except Exception:
+        # 根窗口已经初始化，跳过（未加载成功，下次仍会尝试）
+        pass
+
+
 class FileSelector(ctk.CTkFrame):
     """文件选择组件
 
     支持拖拽 .docx 文件和浏览文件对话框。
     """
 
+    # 共享字体（字体需要根窗口，首次构建界面时创建）
+    _FONT_TITLE = None
+    _FONT_DROP_ZONE = None
+    _FONT_FILE = None
+
+    @classmethod
+    def _init_fonts(cls):
+        """创建各实例共享的字体"""
+        if cls._FONT_TITLE is not None:
+            return
+        cls._FONT_TITLE = ctk.CTkFont(size=14, weight="bold")
+        cls._FONT_DROP_ZONE = ctk.CTkFont(size=12)
+        cls._FONT_FILE = ctk.CTkFont(size=11)
+
     def __init__(self, parent, file_callback: Optional[Callable[[str], None]] = None, **kwargs):
         """初始化文件选择组件
 
@@ -36,11 +75,13 @@ class FileSelector(ctk.CTkFrame):
 
     def _build_ui(self):
         """构建用户界面"""
+        self._init_fonts()
+
         # 标题
         title_label = ctk.CTkLabel(
             self,
             text="文件选择",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._FONT_TITLE
         )
         title_label.pack(pady=(0, 10))
 
@@ -48,7 +89,7 @@ class FileSelector(ctk.CTkFrame):
         self.drop_zone = ctk.CTkLabel(
             self,
             text="拖拽 .docx 文件到此处\n或点击下方按钮选择文件",
-            font=ctk.CTkFont(size=12),
+            font=self._FONT_DROP_ZONE,
             width=400,
             height=100,
             fg_color=("gray85", "gray25"),
@@ -85,7 +126,7 @@ class FileSelector(ctk.CTkFrame):
         self.file_label = ctk.CTkLabel(
             self,
             text="未选择文件",
-            font=ctk.CTkFont(size=11),
+            font=self._FONT_FILE,
             anchor="w"
         )
         self.file_label.pack(fill="x", pady=(10, 0))
@@ -93,22 +134,11 @@ class FileSelector(ctk.CTkFrame):
     def _setup_drag_drop(self):
         """设置拖拽支持"""
         try:
-            # 获取根窗口并尝试启用拖拽
-            root = self.winfo_toplevel()
-
             # 尝试导入并使用 tkinterdnd2
-            from tkinterdnd2 import TkinterDnD, DND_FILES
-
-            # 检查根窗口是否已启用 TkinterDnD
-            if not hasattr(root, '_tkinterDnD_initialized'):
-                # 尝试为根窗口启用拖拽支持
-                try:
-                    # 这可能会失败，因为 CustomTkinter 的主窗口已经初始化
-                    TkinterDnD.load(root)
-                    root._tkinterDnD_initialized = True
-                except:
-                    # 根窗口已经初始化，跳过
-                    pass
+            from tkinterdnd2 import DND_FILES
+
+            # 为根窗口加载 tkdnd（已加载的根窗口不再重复加载）
+            _ensure_dnd(self.winfo_toplevel())
 
             # 绑定拖拽事件到 drop_zone
             self.drop_zone.drop_target_register(DND_FILES)
@@ -136,31 +166,17 @@ class FileSelector(ctk.CTkFrame):
     def _on_drop(self, event):
         """处理文件拖放"""
         try:
-            # 获取拖放的文件路径
-            files = event.data
-            if isinstance(files, str):
-                # Windows 路径可能使用大括号包裹
-                files = files.strip("{}")
-
-                # 可能包含多个文件（用空格分隔）
-                # 尝试分割
-                file_paths = []
-                if files.startswith("{") and "}" in files:
-                    # 处理 Windows 风格的路径
-                    files = files.strip("{}")
-                    if "\n" in files:
-                        file_paths = files.split("\n")
-                    else:
-                        file_paths = [files]
-                else:
-                    file_paths = [files]
-
-                # 处理每个文件
-                for file_path in file_paths:
-                    file_path = file_path.strip().strip('"').strip("'")
-                    if file_path and self._validate_file(file_path):
-                        self.set_file(file_path)
-                        break  # 只处理第一个有效文件
+            # 拖放数据是 Tcl 列表，含空格或大括号的路径由 Tcl 解析
+            try:
+                file_paths = self.tk.splitlist(event.data)
+            except tk.TclError:
+                file_paths = [event.data]
+
+            # 只处理第一个有效文件
+            for file_path in file_paths:
+                if file_path and self._validate_file(file_path):
+                    self.set_file(file_path)
+                    break
 
         except Exception as e:
             print(f"处理拖放文件失败: {e}")
@@ -200,17 +216,12 @@ class FileSelector(ctk.CTkFrame):
         Returns:
             是否为有效的 .docx 文件
         """
-        path = Path(file_path)
-
-        # 检查扩展名
-        if path.suffix.lower() != ".docx":
+        # 先检查扩展名，再访问文件系统
+        if not file_path.lower().endswith(".docx"):
             return False
 
         # 检查文件是否存在
-        if not path.exists():
-            return False
-
-        return True
+        return os.path.isfile(file_path)
 
     def set_file(self, file_path: str):
         """设置选中的文件
@@ -3,9 +3,10 @@
 显示处理进度和实时日志。
 """
 
+import time
 import customtkinter as ctk
-from typing import Optional
-from datetime import datetime
+from collections import deque
+from typing import List, Optional, Tuple
 
 
 class ProgressPanel(ctk.CTkFrame):
@@ -22,6 +23,36 @@ class ProgressPanel(ctk.CTkFrame):
         "SUCCESS": ("dark green", "gray90")
     }
 
+    # 进度刷新间隔（毫秒）
+    PROGRESS_FLUSH_MS = 50
+
+    # 进度条最小重绘变化量（小于该值的变化不重绘）
+    PROGRESS_MIN_DELTA = 0.005
+
+    # 日志最大行数
+    MAX_LOG_LINES = 500
+
+    # 日志批量写入间隔（毫秒）
+    LOG_DRAIN_MS = 100
+
+    # 共享字体（字体需要根窗口，首次构建界面时创建）
+    _FONT_TITLE = None
+    _FONT_STATUS = None
+    _FONT_LOG_TITLE = None
+    _FONT_BUTTON = None
+    _FONT_LOG = None
+
+    @classmethod
+    def _init_fonts(cls):
+        """创建各实例共享的字体"""
+        if cls._FONT_TITLE is not None:
+            return
+        cls._FONT_TITLE = ctk.CTkFont(size=14, weight="bold")
+        cls._FONT_STATUS = ctk.CTkFont(size=11)
+        cls._FONT_LOG_TITLE = ctk.CTkFont(size=12, weight="bold")
+        cls._FONT_BUTTON = ctk.CTkFont(size=10)
+        cls._FONT_LOG = ctk.CTkFont(family="Courier", size=10)
+
     def __init__(self, parent, **kwargs):
         """初始化进度面板
 
@@ -34,15 +65,33 @@ class ProgressPanel(ctk.CTkFrame):
         self._current_progress = 0
         self._total_progress = 100
 
+        # 待刷新的进度（合并高频更新，由 after() 定时刷新）
+        self._pending_progress = None
+        self._flush_scheduled = False
+        self._last_applied_fraction = -1.0
+
+        # 日志行数（避免每次都从文本框统计）
+        self._log_line_count = 0
+
+        # 待写入的日志 (timestamp, level, message)，有日志入队时安排定时器批量写入文本框
+        self._pending_logs = deque()
+        self._drain_after_id = None
+
+        # 按秒缓存的时间戳字符串
+        self._last_ts_sec = 0
+        self._last_ts_str = ""
+
         self._build_ui()
 
     def _build_ui(self):
         """构建用户界面"""
+        self._init_fonts()
+
         # 标题
         title_label = ctk.CTkLabel(
             self,
             text="处理进度",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._FONT_TITLE
         )
         title_label.pack(pady=(0, 10), anchor="w")
 
@@ -60,7 +109,7 @@ class ProgressPanel(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             self,
             text="就绪",
-            font=ctk.CTkFont(size=11),
+            font=self._FONT_STATUS,
             anchor="w"
         )
         self.status_label.pack(fill="x", pady=(0, 10))
@@ -76,7 +125,7 @@ class ProgressPanel(ctk.CTkFrame):
         log_title = ctk.CTkLabel(
             log_header,
             text="处理日志",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._FONT_LOG_TITLE
         )
         log_title.pack(side="left")
 
@@ -87,7 +136,7 @@ class ProgressPanel(ctk.CTkFrame):
             width=60,
             height=24,
             command=self._clear_logs,
-            font=ctk.CTkFont(size=10),
+            font=self._FONT_BUTTON,
             fg_color=("gray70", "gray30"),
             hover_color=("gray60", "gray20")
         )
@@ -97,7 +146,7 @@ class ProgressPanel(ctk.CTkFrame):
         self.log_textbox = ctk.CTkTextbox(
             log_frame,
             height=200,
-            font=ctk.CTkFont(family="Courier", size=10)
+            font=self._FONT_LOG
         )
         self.log_textbox.pack(fill="both", expand=True)
         self.log_textbox.configure(state="disabled")
@@ -110,7 +159,8 @@ class ProgressPanel(ctk.CTkFrame):
         """
         self._current_progress = 0
         self._total_progress = total
-        self.progress_bar.set(0)
+        self._pending_progress = None
+        self._set_bar(0)
         self.set_status("正在处理...")
 
     def update_progress(self, current: int, total: Optional[int] = None, message: str = ""):
@@ -126,13 +176,32 @@ class ProgressPanel(ctk.CTkFrame):
 
         self._current_progress = current
 
+        # 只记录最新进度，由定时器合并刷新，避免每次更新都调用 Tk
+        self._pending_progress = (current, self._total_progress, message)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(self.PROGRESS_FLUSH_MS, self._flush_progress)
+
+    def _flush_progress(self):
+        """将最新的进度应用到进度条和状态标签"""
+        self._flush_scheduled = False
+        pending = self._pending_progress
+        if pending is None:
+            return
+        self._pending_progress = None
+
+        current, total, message = pending
+
         # 计算进度百分比
-        if self._total_progress > 0:
-            progress = current / self._total_progress
+        if total > 0:
+            progress = current / total
         else:
             progress = 0
 
-        self.progress_bar.set(progress)
+        # 变化太小时跳过重绘（起点和终点始终绘制）
+        if (abs(progress - self._last_applied_fraction) >= self.PROGRESS_MIN_DELTA
+                or progress in (0.0, 1.0)):
+            self._set_bar(progress)
 
         # 更新状态
         if message:
@@ -141,6 +210,15 @@ class ProgressPanel(ctk.CTkFrame):
             percentage = int(progress * 100)
             self.set_status(f"处理中... {percentage}%")
 
+    def _set_bar(self, fraction: float):
+        """设置进度条并记录已绘制的值
+
+        Args:
+            fraction: 进度（0-1）
+        """
+        self._last_applied_fraction = fraction
+        self.progress_bar.set(fraction)
+
     def set_status(self, message: str):
         """设置状态消息
 
@@ -156,31 +234,66 @@ class ProgressPanel(ctk.CTkFrame):
             level: 日志级别 (INFO, WARNING, ERROR, SUCCESS)
             message: 日志消息
         """
-        # 生成时间戳
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        # 格式化日志
-        log_line = f"{timestamp} | {level: <7} | {message}\n"
-
-        # 启用文本框以添加内容
-        self.log_textbox.configure(state="normal")
+        # 只入队，由 _drain_logs 批量写入
+        self._pending_logs.append((self._timestamp(), level, message))
+        self._schedule_drain()
 
-        # 获取当前内容
-        current_content = self.log_textbox.get("1.0", "end")
+    def add_logs(self, entries: List[Tuple[str, str]]):
+        """批量添加日志消息
 
-        # 添加新日志
-        self.log_textbox.insert("end", log_line)
-
-        # 如果日志太多，删除旧的
-        line_count = int(self.log_textbox.index("end-1c").split(".")[0])
-        if line_count > 500:
-            self.log_textbox.delete("1.0", "100.0")
+        Args:
+            entries: (level, message) 列表
+        """
+        timestamp = self._timestamp()
+        self._pending_logs.extend((timestamp, level, message) for level, message in entries)
+        self._schedule_drain()
 
-        # 滚动到底部
-        self.log_textbox.see("end")
+    def _timestamp(self) -> str:
+        """当前时间戳（同一秒内复用已格式化的字符串）
 
-        # 禁用文本框
-        self.log_textbox.configure(state="disabled")
+        Returns:
+            HH:MM:SS 格式的时间
+        """
+        sec = int(time.time())
+        if sec != self._last_ts_sec:
+            self._last_ts_sec = sec
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        return self._last_ts_str
+
+    def _schedule_drain(self):
+        """安排一次日志写入（已安排时不重复安排）"""
+        if self._drain_after_id is None:
+            self._drain_after_id = self.after(self.LOG_DRAIN_MS, self._drain_logs)
+
+    def _drain_logs(self):
+        """将待写入的日志一次性写入文本框（之后入队的日志会重新安排写入）"""
+        self._drain_after_id = None
+        pending = self._pending_logs
+        if pending:
+            lines = []
+            while pending:
+                timestamp, level, message = pending.popleft()
+                lines.append(f"{timestamp} | {level: <7} | {message}\n")
+
+            # 启用文本框以添加内容
+            self.log_textbox.configure(state="normal")
+
+            # 添加新日志
+            text = "".join(lines)
+            self.log_textbox.insert("end", text)
+
+            # 如果日志太多，删除旧的（按实际插入的换行计数，消息本身可能包含多行）
+            self._log_line_count += text.count("\n")
+            excess = self._log_line_count - self.MAX_LOG_LINES
+            if excess > 0:
+                self.log_textbox.delete("1.0", f"{excess + 1}.0")
+                self._log_line_count -= excess
+
+            # 滚动到底部
+            self.log_textbox.see("end")
+
+            # 禁用文本框
+            self.log_textbox.configure(state="disabled")
 
     def log_info(self, message: str):
         """添加信息日志"""
@@ -200,14 +313,17 @@ class ProgressPanel(ctk.CTkFrame):
 
     def _clear_logs(self):
         """清除日志"""
+        self._pending_logs.clear()
         self.log_textbox.configure(state="normal")
         self.log_textbox.delete("1.0", "end")
         self.log_textbox.configure(state="disabled")
+        self._log_line_count = 0
 
     def clear_logs(self):
         """清除所有日志和进度"""
         self._clear_logs()
-        self.progress_bar.set(0)
+        self._pending_progress = None
+        self._set_bar(0)
         self.set_status("就绪")
 
     def finish_progress(self, success: bool, message: str = ""):
@@ -217,7 +333,8 @@ class ProgressPanel(ctk.CTkFrame):
             success: 是否成功
             message: 完成消息
         """
-        self.progress_bar.set(1.0)
+        self._pending_progress = None
+        self._set_bar(1.0)
 
         if success:
             self.set_status(message or "处理完成")
@@ -225,3 +342,10 @@ class ProgressPanel(ctk.CTkFrame):
         else:
             self.set_status(message or "处理失败")
             self.log_error(message or "处理失败")
+
+    def destroy(self):
+        """销毁面板，取消尚未执行的日志写入"""
+        if self._drain_after_id is not None:
+            self.after_cancel(self._drain_after_id)
+            self._drain_after_id = None
+        super().destroy()
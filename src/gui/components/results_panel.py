@@ -4,10 +4,24 @@
 """
 
 import customtkinter as ctk
+import csv
 import json
+from itertools import groupby
+from operator import attrgetter
+from tkinter import filedialog
 from typing import List, Dict, Optional
 from pathlib import Path
 
+# 可分组的错误类型，其他类型归入 'structure'
+ERROR_TYPES = frozenset(('title', 'url', 'image', 'structure'))
+
+_line_index_key = attrgetter('line_index')
+
+
+def _group_index_key(error) -> int:
+    """错误所在的组序号（三行一组，从1开始）"""
+    return error.line_index // 3 + 1
+
 
 class ResultsPanel(ctk.CTkFrame):
     """结果面板
@@ -15,6 +29,37 @@ class ResultsPanel(ctk.CTkFrame):
     显示校验错误，支持按类型分组和导出。
     """
 
+    # 标签页名称 -> 错误分组
+    TAB_GROUPS = {
+        "全部错误": "all",
+        "标题行错误": "title",
+        "URL错误": "url",
+        "图片错误": "image"
+    }
+
+    # 文本标签颜色（按错误严重程度）
+    TAG_COLORS = {
+        "group": "#3B8ED0",
+        "error": "#D9534F",
+        "warning": "#E69500",
+        "info": "gray50",
+        "empty": "gray50"
+    }
+
+    # 共享字体（字体需要根窗口，首次构建界面时创建）
+    _FONT_TITLE = None
+    _FONT_COUNT = None
+    _FONT_ITEM = None
+
+    @classmethod
+    def _init_fonts(cls):
+        """创建各实例共享的字体"""
+        if cls._FONT_TITLE is not None:
+            return
+        cls._FONT_TITLE = ctk.CTkFont(size=14, weight="bold")
+        cls._FONT_COUNT = ctk.CTkFont(size=12)
+        cls._FONT_ITEM = ctk.CTkFont(size=10)
+
     def __init__(self, parent, **kwargs):
         """初始化结果面板
 
@@ -33,10 +78,22 @@ class ResultsPanel(ctk.CTkFrame):
             'structure': []
         }
 
+        # 内容已过期、尚未重新渲染的标签页
+        self._dirty_tabs = set()
+
+        # 上次显示的错误列表指纹
+        self._last_fingerprint = None
+
+        # 分批渲染：每批错误数（None 表示一次插入）和各标签页的渲染序号
+        self._render_chunk: Optional[int] = None
+        self._render_tokens: Dict[str, int] = {}
+
         self._build_ui()
 
     def _build_ui(self):
         """构建用户界面"""
+        self._init_fonts()
+
         # 标题框架
         header_frame = ctk.CTkFrame(self, fg_color="transparent")
         header_frame.pack(fill="x", pady=(0, 10))
@@ -44,7 +101,7 @@ class ResultsPanel(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_frame,
             text="校验结果",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._FONT_TITLE
         )
         title_label.pack(side="left")
 
@@ -52,27 +109,30 @@ class ResultsPanel(ctk.CTkFrame):
         self.count_label = ctk.CTkLabel(
             header_frame,
             text="共 0 个问题",
-            font=ctk.CTkFont(size=12),
+            font=self._FONT_COUNT,
             text_color=("gray60", "gray40")
         )
         self.count_label.pack(side="right")
 
         # 标签页
-        self.tabview = ctk.CTkTabview(self, width=400, height=300)
+        self.tabview = ctk.CTkTabview(self, width=400, height=300, command=self._on_tab_changed)
         self.tabview.pack(fill="both", expand=True, pady=(0, 10))
 
         # 创建标签页
-        self.tab_names = ["全部错误", "标题行错误", "URL错误", "图片错误"]
+        self.tab_names = list(self.TAB_GROUPS)
         for tab_name in self.tab_names:
             self.tabview.add(tab_name)
 
-        # 为每个标签页创建滚动框架
-        self.scroll_frames = {}
+        # 为每个标签页创建文本框（用标签着色，而不是每个错误一个组件）
+        self.error_textboxes = {}
         for tab_name in self.tab_names:
             tab = self.tabview.tab(tab_name)
-            scroll_frame = ctk.CTkScrollableFrame(tab, width=380, height=280)
-            scroll_frame.pack(fill="both", expand=True)
-            self.scroll_frames[tab_name] = scroll_frame
+            textbox = ctk.CTkTextbox(tab, width=380, height=280, font=self._FONT_ITEM, wrap="word")
+            textbox.pack(fill="both", expand=True)
+            for tag, color in self.TAG_COLORS.items():
+                textbox.tag_config(tag, foreground=color)
+            textbox.configure(state="disabled")
+            self.error_textboxes[tab_name] = textbox
 
         # 导出按钮框架
         export_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -102,29 +162,71 @@ class ResultsPanel(ctk.CTkFrame):
         Args:
             errors: 错误列表
         """
+        self._display(errors, None)
+
+    def display_errors_async(self, errors: List, chunk: int = 200):
+        """分批显示错误列表
+
+        先立即显示前 chunk 个错误，其余通过 after() 分批插入，界面保持响应。
+
+        Args:
+            errors: 错误列表
+            chunk: 每批插入的错误数
+        """
+        self._display(errors, chunk)
+
+    def _display(self, errors: List, chunk: Optional[int]):
+        """显示错误列表
+
+        Args:
+            errors: 错误列表
+            chunk: 每批插入的错误数，None 表示一次插入
+        """
+        # 错误内容与上次相同时无需重新渲染
+        fingerprint = self._fingerprint(errors)
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+
+        self._render_chunk = chunk
         self.current_errors = errors
         self._group_errors(errors)
         self._update_count_label()
         self._render_errors()
 
+    @staticmethod
+    def _fingerprint(errors: List) -> tuple:
+        """计算错误列表的指纹
+
+        Args:
+            errors: 错误列表
+
+        Returns:
+            (错误数量, 内容哈希)
+        """
+        return len(errors), hash(tuple(
+            (error.line_index, error.line_type, error.message, error.severity)
+            for error in errors
+        ))
+
     def _group_errors(self, errors: List):
         """分组错误
 
         Args:
             errors: 错误列表
         """
-        # 清空分组
-        for key in self.error_groups:
-            self.error_groups[key] = []
+        # 'all' 直接引用错误列表，其余分组单次遍历填充
+        groups = self.error_groups = {
+            'all': errors,
+            'title': [],
+            'url': [],
+            'image': [],
+            'structure': []
+        }
 
-        # 分组
         for error in errors:
-            self.error_groups['all'].append(error)
-
             error_type = error.line_type
-            if error_type not in self.error_groups:
-                error_type = 'structure'
-            self.error_groups[error_type].append(error)
+            groups[error_type if error_type in ERROR_TYPES else 'structure'].append(error)
 
     def _update_count_label(self):
         """更新错误计数标签"""
@@ -132,17 +234,25 @@ class ResultsPanel(ctk.CTkFrame):
         self.count_label.configure(text=f"共 {total} 个问题")
 
     def _render_errors(self):
-        """渲染错误到界面"""
-        # 清空所有滚动框架的内容
-        for scroll_frame in self.scroll_frames.values():
-            for widget in scroll_frame.winfo_children():
-                widget.destroy()
-
-        # 渲染各标签的错误
-        self._render_tab_errors("全部错误", self.error_groups.get('all', []))
-        self._render_tab_errors("标题行错误", self.error_groups.get('title', []))
-        self._render_tab_errors("URL错误", self.error_groups.get('url', []))
-        self._render_tab_errors("图片错误", self.error_groups.get('image', []))
+        """渲染错误到界面
+
+        只渲染当前可见的标签页，其余标签页在切换到时再渲染。
+        """
+        self._dirty_tabs = set(self.tab_names)
+        self._render_current_tab()
+
+    def _render_current_tab(self):
+        """渲染当前标签页（如果内容已过期）"""
+        tab_name = self.tabview.get()
+        if tab_name not in self._dirty_tabs:
+            return
+
+        self._dirty_tabs.discard(tab_name)
+        self._render_tab_errors(tab_name, self.error_groups.get(self.TAB_GROUPS[tab_name], []))
+
+    def _on_tab_changed(self):
+        """标签页切换回调"""
+        self._render_current_tab()
 
     def _render_tab_errors(self, tab_name: str, errors: List):
         """渲染特定标签的错误
@@ -151,88 +261,94 @@ class ResultsPanel(ctk.CTkFrame):
             tab_name: 标签名称
             errors: 错误列表
         """
-        scroll_frame = self.scroll_frames.get(tab_name)
-        if not scroll_frame:
+        textbox = self.error_textboxes.get(tab_name)
+        if not textbox:
             return
 
+        # 新的渲染使该标签页尚未完成的分批插入失效
+        token = self._render_tokens.get(tab_name, 0) + 1
+        self._render_tokens[tab_name] = token
+
         if not errors:
             # 无错误时显示提示
-            no_errors_label = ctk.CTkLabel(
-                scroll_frame,
-                text="无错误",
-                font=ctk.CTkFont(size=12),
-                text_color=("gray60", "gray40")
-            )
-            no_errors_label.pack(pady=20)
+            self._show_empty(textbox)
             return
 
-        # 按组索引分组显示
-        groups: Dict[int, List] = {}
-        for error in errors:
-            group_index = error.line_index // 3 + 1
-            if group_index not in groups:
-                groups[group_index] = []
-            groups[group_index].append(error)
+        textbox.configure(state="normal")
+        textbox.delete("1.0", "end")
 
-        # 显示每个组
-        for group_index in sorted(groups.keys()):
-            group_errors = groups[group_index]
+        textbox.configure(state="disabled")
 
-            # 组标题
-            group_frame = ctk.CTkFrame(scroll_frame, fg_color=("gray85", "gray25"))
-            group_frame.pack(fill="x", pady=(5, 0), padx=5)
-
-            group_label = ctk.CTkLabel(
-                group_frame,
-                text=f"▼ 第{group_index}组 ({len(group_errors)}个错误)",
-                font=ctk.CTkFont(size=11, weight="bold"),
-                anchor="w"
-            )
-            group_label.pack(fill="x", padx=10, pady=5)
+        # 按组索引分组显示（校验结果通常已按行排序，sorted 在此情况下接近线性）
+        errors = sorted(errors, key=_line_index_key)
+        groups = groupby(errors, key=_group_index_key)
+        self._insert_groups(tab_name, textbox, groups, token)
 
-            # 组内容（嵌入到外层）
-            group_content = ctk.CTkFrame(scroll_frame, fg_color="transparent")
-            group_content.pack(fill="x", padx=10, pady=(0, 10))
+    def _insert_groups(self, tab_name: str, textbox, groups, token: int):
+        """将分组后的错误插入文本框，超过每批数量时通过 after() 继续
+
+        Args:
+            tab_name: 标签名称
+            textbox: 标签页文本框
+            groups: (组序号, 错误迭代器) 的迭代器
+            token: 渲染序号，与当前序号不一致时放弃插入
+        """
+        if self._render_tokens.get(tab_name) != token:
+            return
+
+        chunk = self._render_chunk
+        inserted = 0
+        textbox.configure(state="normal")
+
+        # 显示每个组，相同严重程度的连续错误合并为一次插入
+        for group_index, group_iter in groups:
+            group_errors = list(group_iter)
+
+            # 组标题
+            textbox.insert("end", f"▼ 第{group_index}组 ({len(group_errors)}个错误)\n", "group")
 
+            lines = []
+            severity = None
             for error in group_errors:
-                error_item = self._create_error_item(group_content, error)
-                error_item.pack(fill="x", pady=2)
+                if error.severity != severity and lines:
+                    textbox.insert("end", "".join(lines), severity)
+                    lines = []
+                severity = error.severity
+                lines.append(self._format_error(error))
+            lines.append("\n")
+            textbox.insert("end", "".join(lines), severity)
+
+            inserted += len(group_errors)
+            if chunk and inserted >= chunk:
+                textbox.configure(state="disabled")
+                self.after(1, self._insert_groups, tab_name, textbox, groups, token)
+                return
+
+        textbox.configure(state="disabled")
+
+    @staticmethod
+    def _show_empty(textbox):
+        """在文本框中只显示“无错误”提示
 
-    def _create_error_item(self, parent, error) -> ctk.CTkFrame:
-        """创建错误项组件
+        Args:
+            textbox: 标签页文本框
+        """
+        textbox.configure(state="normal")
+        textbox.delete("1.0", "end")
+        textbox.insert("end", "无错误", "empty")
+        textbox.configure(state="disabled")
+
+    @staticmethod
+    def _format_error(error) -> str:
+        """格式化单个错误为一行文本
 
         Args:
-            parent: 父组件
             error: 错误对象
 
         Returns:
-            错误项组件
+            格式化后的文本行
         """
-        error_frame = ctk.CTkFrame(
-            parent,
-            fg_color=("gray80", "gray20"),
-            corner_radius=5
-        )
-
-        # 类型标签
-        type_label = ctk.CTkLabel(
-            error_frame,
-            text=f"[{error.line_type}]",
-            font=ctk.CTkFont(size=10),
-            width=60
-        )
-        type_label.pack(side="left", padx=(10, 5))
-
-        # 行号和消息
-        text_label = ctk.CTkLabel(
-            error_frame,
-            text=f"行{error.line_index + 1}: {error.message}",
-            font=ctk.CTkFont(size=10),
-            anchor="w"
-        )
-        text_label.pack(side="left", padx=(0, 10), fill="x", expand=True)
-
-        return error_frame
+        return f"    [{error.line_type}] 行{error.line_index + 1}: {error.message}\n"
 
     def _export_errors(self, format: str):
         """导出错误到文件
@@ -244,12 +360,6 @@ class ResultsPanel(ctk.CTkFrame):
             return
 
         # 获取保存路径
-        from tkinter import filedialog
-        from tkinter import Tk
-
-        root = Tk()
-        root.withdraw()
-
         if format == "json":
             file_types = [("JSON 文件", "*.json"), ("所有文件", "*.*")]
             default_ext = ".json"
@@ -258,13 +368,12 @@ class ResultsPanel(ctk.CTkFrame):
             default_ext = ".csv"
 
         file_path = filedialog.asksaveasfilename(
+            parent=self.winfo_toplevel(),
             title=f"导出错误为 {format.upper()}",
             defaultextension=default_ext,
             filetypes=file_types
         )
 
-        root.destroy()
-
         if not file_path:
             return
 
@@ -282,16 +391,19 @@ class ResultsPanel(ctk.CTkFrame):
         Args:
             file_path: 文件路径
         """
-        errors_data = []
-        for error in self.current_errors:
-            errors_data.append({
-                "line_index": error.line_index,
-                "line_type": error.line_type,
-                "message": error.message
-            })
-
+        # 逐条写入，每个错误一行，不在内存中构建完整列表
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(errors_data, f, ensure_ascii=False, indent=2)
+            f.write("[")
+            separator = "\n  "
+            for error in self.current_errors:
+                f.write(separator)
+                f.write(json.dumps({
+                    "line_index": error.line_index,
+                    "line_type": error.line_type,
+                    "message": error.message
+                }, ensure_ascii=False))
+                separator = ",\n  "
+            f.write("\n]\n")
 
     def _export_csv(self, file_path: str):
         """导出为 CSV 格式
@@ -299,22 +411,26 @@ class ResultsPanel(ctk.CTkFrame):
         Args:
             file_path: 文件路径
         """
-        import csv
-
         with open(file_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(["行号", "类型", "消息"])
 
-            for error in self.current_errors:
-                writer.writerow([
-                    error.line_index + 1,
-                    error.line_type,
-                    error.message
-                ])
+            writer.writerows(
+                (error.line_index + 1, error.line_type, error.message)
+                for error in self.current_errors
+            )
 
     def clear_results(self):
         """清除结果显示"""
+        self._last_fingerprint = None
         self.current_errors = []
         self.error_groups = {key: [] for key in self.error_groups}
         self._update_count_label()
-        self._render_errors()
+
+        # 结果已知为空，直接显示提示，无需分组渲染；
+        # 递增渲染序号使尚未完成的分批插入失效（清空序号会与新渲染的序号重复）
+        self._dirty_tabs.clear()
+        tokens = self._render_tokens
+        for tab_name, textbox in self.error_textboxes.items():
+            tokens[tab_name] = tokens.get(tab_name, 0) + 1
+            self._show_empty(textbox)
@@ -3,8 +3,6 @@
 连接 GUI 和核心逻辑，管理处理流程。
 """
 
-import threading
-import queue
 from typing import Optional, List, Callable, Dict, Any
 from pathlib import Path
 from loguru import logger
@@ -17,9 +15,12 @@ from rules.structure_rules import ThreeLineGroupValidationRule
 # 导入 GUI 工具
 from gui.utils.theme_manager import ThemeManager
 from gui.utils.threading_helpers import (
-    ProgressQueue, WorkerThread, ProcessCallback, InterruptedException
+    ProgressQueue, WorkerTask, TaskRunner, ProcessCallback, InterruptedException
 )
 
+# 可分组的错误类型，其他类型归入 'structure'
+ERROR_TYPES = frozenset(('title', 'url', 'image', 'structure'))
+
 
 class MainController:
     """主控制器
@@ -39,14 +40,12 @@ class MainController:
         self.rule_engine: Optional[RuleEngine] = None
         self.processor: Optional[DocumentProcessor] = None
 
-        # 进度队列和线程
+        # 进度队列和后台线程（单线程复用，不为每个任务创建新线程）
         self.progress_queue = ProgressQueue()
-        self.worker_thread: Optional[WorkerThread] = None
-        self.cancel_flag = threading.Event()
+        self.task_runner = TaskRunner()
 
         # 状态
         self.current_file: Optional[str] = None
-        self.processing: bool = False
         self.last_result: Optional[ProcessingResult] = None
 
         # 初始化核心组件
@@ -118,17 +117,14 @@ class MainController:
             return False
 
         self.current_file = file_path
-        self.cancel_flag.clear()
 
-        # 创建工作线程
-        self.worker_thread = ValidateWorker(
+        # 提交后台任务
+        self.task_runner.submit(ValidateWorker(
             progress_queue=self.progress_queue,
             controller=self,
             file_path=file_path
-        )
-        self.worker_thread.start()
+        ))
 
-        self.processing = True
         return True
 
     def process_file_async(self, file_path: str, fix_errors: bool = False) -> bool:
@@ -146,26 +142,31 @@ class MainController:
             return False
 
         self.current_file = file_path
-        self.cancel_flag.clear()
 
-        # 创建工作线程
-        self.worker_thread = ProcessWorker(
+        # 提交后台任务
+        self.task_runner.submit(ProcessWorker(
             progress_queue=self.progress_queue,
             controller=self,
             file_path=file_path,
             fix_errors=fix_errors
-        )
-        self.worker_thread.start()
+        ))
 
-        self.processing = True
         return True
 
+    @property
+    def processing(self) -> bool:
+        """是否有任务正在处理（任务结束或出错后自动变为 False）"""
+        return self.task_runner.is_running()
+
     def cancel_processing(self):
         """取消当前处理"""
-        if self.worker_thread and self.worker_thread.is_alive():
-            self.cancel_flag.set()
+        if self.task_runner.cancel():
             logger.info("已请求取消处理")
 
+    def shutdown(self):
+        """关闭后台线程池（不等待当前任务）"""
+        self.task_runner.shutdown()
+
     def get_error_groups(self) -> Dict[str, List]:
         """获取按类型分组的错误
 
@@ -185,9 +186,7 @@ class MainController:
 
         for error in errors:
             error_type = error.line_type
-            if error_type not in groups:
-                error_type = 'structure'
-            groups[error_type].append(error)
+            groups[error_type if error_type in ERROR_TYPES else 'structure'].append(error)
 
         return groups
 
@@ -202,11 +201,11 @@ class MainController:
         return self.rule_engine.get_all_errors()
 
 
-class ValidateWorker(WorkerThread):
-    """校验工作线程"""
+class ValidateWorker(WorkerTask):
+    """校验任务"""
 
-    def __init__(self, progress_queue: queue.Queue, controller: MainController, file_path: str):
-        """初始化校验工作线程
+    def __init__(self, progress_queue: ProgressQueue, controller: MainController, file_path: str):
+        """初始化校验任务
 
         Args:
             progress_queue: 进度队列
@@ -226,7 +225,7 @@ class ValidateWorker(WorkerThread):
         self.emit_log("INFO", f"开始校验文档: {self.file_path}")
 
         # 创建回调
-        callback = ProcessCallback(self.progress_queue, self._cancel_flag)
+        callback = ProcessCallback(self.progress_queue, self.is_cancelled)
 
         # 执行校验
         result = self.controller.processor.validate_only(
@@ -238,17 +237,16 @@ class ValidateWorker(WorkerThread):
 
         # 保存结果
         self.controller.last_result = result
-        self.controller.processing = False
 
         return result
 
 
-class ProcessWorker(WorkerThread):
-    """处理工作线程"""
+class ProcessWorker(WorkerTask):
+    """处理任务"""
 
-    def __init__(self, progress_queue: queue.Queue, controller: MainController,
+    def __init__(self, progress_queue: ProgressQueue, controller: MainController,
                  file_path: str, fix_errors: bool = False):
-        """初始化处理工作线程
+        """初始化处理任务
 
         Args:
             progress_queue: 进度队列
@@ -272,7 +270,6 @@ class ProcessWorker(WorkerThread):
 
         # 生成输出文件名
         if self.fix_errors:
-            from pathlib import Path
             path_obj = Path(self.file_path)
             output_path = str(path_obj.parent / f"{path_obj.stem}_fixed{path_obj.suffix}")
             self.emit_log("INFO", f"输出文件: {output_path}")
@@ -291,6 +288,5 @@ class ProcessWorker(WorkerThread):
 
         # 保存结果
         self.controller.last_result = result
-        self.controller.processing = False
 
         return result
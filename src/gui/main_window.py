@@ -4,9 +4,8 @@ DocuRuleFix 的主窗口，整合所有组件。
 """
 
 import customtkinter as ctk
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import tkinter as tk
-from tkinter import filedialog
 import subprocess
 import os
 import sys
@@ -21,6 +20,53 @@ from gui.components.progress_panel import ProgressPanel
 from gui.components.results_panel import ResultsPanel
 from gui.utils.threading_helpers import ProgressEventType
 
+# 图标资源目录
+if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+    # PyInstaller 打包后的环境
+    _RESOURCE_BASE = Path(sys._MEIPASS) / "src" / "resources" / "icons"
+else:
+    # 开发环境
+    _RESOURCE_BASE = Path(__file__).parent.parent / "resources" / "icons"
+
+# 可能的窗口图标路径（macOS 优先使用 PNG，Windows 优先使用 ICO）
+if sys.platform == 'darwin':  # macOS
+    _ICON_PATHS = (
+        _RESOURCE_BASE / "icon_512x512.png",
+        _RESOURCE_BASE / "icon_256x256.png",
+        # 回退到相对路径
+        Path("resources") / "icons" / "icon_512x512.png",
+        Path("resources") / "icons" / "icon_256x256.png",
+    )
+else:  # Windows/Linux
+    _ICON_PATHS = (
+        _RESOURCE_BASE / "DocuRuleFix.ico",
+        _RESOURCE_BASE / "icon_256x256.png",
+        # 回退到相对路径
+        Path("resources") / "icons" / "DocuRuleFix.ico",
+        Path("resources") / "icons" / "icon_256x256.png",
+    )
+
+# 存在的图标路径 (str, Path)（只在模块加载时探测一次，str 用于 Tk 调用）
+_EXISTING_ICON_PATHS = tuple(
+    (icon_str, path) for icon_str, path in ((str(path), path) for path in _ICON_PATHS)
+    if os.path.exists(icon_str)
+)
+
+# macOS Dock 图标
+_MAC_ICNS_PATH = _RESOURCE_BASE / "DocuRuleFix.icns"
+_MAC_PNG_PATH = _RESOURCE_BASE / "icon_512x512.png"
+_MAC_ICNS_EXISTS = sys.platform == 'darwin' and os.path.exists(_MAC_ICNS_PATH)
+_MAC_PNG_EXISTS = sys.platform == 'darwin' and os.path.exists(_MAC_PNG_PATH)
+
+# 已加载的窗口图标（按路径缓存）
+_ICON_CACHE: Dict[str, tk.PhotoImage] = {}
+
+# 上次成功设置的窗口图标路径 (str, Path)
+_icon_path_cache: Optional[Tuple[str, Path]] = None
+
+# 已解码的 macOS Dock 图标（NSImage）
+_dock_image = None
+
 
 class MainWindow(ctk.CTk):
     """主窗口
@@ -28,6 +74,26 @@ class MainWindow(ctk.CTk):
     整合所有 GUI 组件的主窗口。
     """
 
+    # 进度队列轮询间隔（毫秒，约 30 帧/秒）
+    QUEUE_POLL_MS = 33
+
+    # 每次轮询最多处理的事件数
+    QUEUE_BATCH_SIZE = 200
+
+    # 共享字体（字体需要根窗口，首次构建界面时创建）
+    _FONT_TITLE = None
+    _FONT_ACTION = None
+    _FONT_SECONDARY = None
+
+    @classmethod
+    def _init_fonts(cls):
+        """创建各实例共享的字体"""
+        if cls._FONT_TITLE is not None:
+            return
+        cls._FONT_TITLE = ctk.CTkFont(size=20, weight="bold")
+        cls._FONT_ACTION = ctk.CTkFont(size=14, weight="bold")
+        cls._FONT_SECONDARY = ctk.CTkFont(size=12)
+
     def __init__(self):
         """初始化主窗口"""
         super().__init__()
@@ -45,8 +111,23 @@ class MainWindow(ctk.CTk):
 
         self.controller = MainController(self.theme_manager)
 
-        # 当前处理状态
+        # 当前处理状态，以及已应用到按钮的状态（None 表示尚未应用）
         self.is_processing = False
+        self._last_state: Optional[str] = None
+        self._button_state_pending = False
+
+        # 进度事件分发表，以及一批事件中积累的进度和日志
+        self._event_handlers = {
+            ProgressEventType.PROGRESS: self._handle_progress,
+            ProgressEventType.LOG: self._handle_log,
+            ProgressEventType.COMPLETE: self._handle_complete,
+            ProgressEventType.ERROR: self._handle_error
+        }
+        self._batch_progress: Optional[tuple] = None
+        self._batch_logs = []
+
+        # 是否已安排清除结果和日志
+        self._clear_pending = False
 
         # 构建 UI
         self._build_ui()
@@ -55,10 +136,12 @@ class MainWindow(ctk.CTk):
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
         # 启动进度队列处理
-        self.after(100, self._process_progress_queue)
+        self.after(self.QUEUE_POLL_MS, self._process_progress_queue)
 
     def _build_ui(self):
         """构建用户界面"""
+        self._init_fonts()
+
         # 创建主容器
         main_container = ctk.CTkFrame(self)
         main_container.pack(fill="both", expand=True, padx=20, pady=20)
@@ -101,75 +184,70 @@ class MainWindow(ctk.CTk):
 
     def _set_window_icon(self):
         """设置窗口图标"""
-        # 获取资源目录基础路径
-        if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-            # PyInstaller 打包后的环境
-            resource_base = Path(sys._MEIPASS) / "src" / "resources" / "icons"
+        # 已找到可用图标时直接复用，不再逐个探测
+        global _icon_path_cache
+        if _icon_path_cache is not None:
+            icon_paths = (_icon_path_cache,)
         else:
-            # 开发环境
-            resource_base = Path(__file__).parent.parent / "resources" / "icons"
-
-        # 尝试多个可能的图标路径
-        # macOS 优先使用 PNG/ICNS，Windows 优先使用 ICO
-        if sys.platform == 'darwin':  # macOS
-            icon_paths = [
-                resource_base / "icon_512x512.png",
-                resource_base / "icon_256x256.png",
-                # 回退到相对路径
-                Path("resources") / "icons" / "icon_512x512.png",
-                Path("resources") / "icons" / "icon_256x256.png",
-            ]
-        else:  # Windows/Linux
-            icon_paths = [
-                resource_base / "DocuRuleFix.ico",
-                resource_base / "icon_256x256.png",
-                # 回退到相对路径
-                Path("resources") / "icons" / "DocuRuleFix.ico",
-                Path("resources") / "icons" / "icon_256x256.png",
-            ]
-
-        for icon_path in icon_paths:
-            if icon_path.exists():
-                # Windows: 尝试使用 iconbitmap
-                if sys.platform == 'win32' and icon_path.suffix == '.ico':
-                    try:
-                        self.iconbitmap(str(icon_path))
-                        return
-                    except Exception:
-                        pass
+            icon_paths = _EXISTING_ICON_PATHS
 
-                # macOS/Linux: 使用 PhotoImage
-                # 注意：需要保持对 icon 的引用，否则会被垃圾回收
+        for icon_str, icon_path in icon_paths:
+            # Windows: 尝试使用 iconbitmap
+            if sys.platform == 'win32' and icon_path.suffix == '.ico':
                 try:
-                    self._icon = tk.PhotoImage(file=str(icon_path))
-                    self.iconphoto(True, self._icon)
-                    logger.info(f"图标已设置: {icon_path}")
+                    self.iconbitmap(icon_str)
+                    _icon_path_cache = (icon_str, icon_path)
                     return
                 except Exception:
                     pass
 
+            # macOS/Linux: 使用 PhotoImage
+            # 注意：需要保持对 icon 的引用，否则会被垃圾回收
+            try:
+                self._icon = self._load_photo_image(icon_str)
+                self.iconphoto(True, self._icon)
+                _icon_path_cache = (icon_str, icon_path)
+                logger.info(f"图标已设置: {icon_path}")
+                return
+            except Exception:
+                pass
+
         # macOS 特殊处理：尝试设置 dock icon
         if sys.platform == 'darwin':
-            self._set_macos_dock_icon(resource_base)
+            self._set_macos_dock_icon()
+
+    def _load_photo_image(self, icon_str: str) -> tk.PhotoImage:
+        """加载图标图片（按路径缓存，同一 Tk 解释器内复用）
 
-    def _set_macos_dock_icon(self, resource_base: Path):
+        Args:
+            icon_str: 图标路径
+
+        Returns:
+            PhotoImage 对象
+        """
+        image = _ICON_CACHE.get(icon_str)
+        if image is None or image.tk is not self.tk:
+            image = tk.PhotoImage(master=self, file=icon_str)
+            _ICON_CACHE[icon_str] = image
+        return image
+
+    def _set_macos_dock_icon(self):
         """macOS Dock 图标设置
 
         注意：在 macOS 上，Tkinter/CustomTkinter 的窗口图标设置功能有限。
         窗口标题栏的图标可以通过 iconphoto() 设置，但 Dock 中的图标需要：
         1. 将应用打包为 .app bundle，并在 Info.plist 中指定 CFBundleIconFile
         2. 或者使用 Cocoa API 调用（通过 pyobjc）
-
-        Args:
-            resource_base: 资源文件基础路径
         """
+        global _dock_image
+
         # 尝试使用 Cocoa API 设置 Dock 图标
         try:
-            # 查找 icns 和 png 文件
-            icns_path = resource_base / "DocuRuleFix.icns"
-            png_path = resource_base / "icon_512x512.png"
+            # icns 和 png 文件（路径在模块加载时确定）
+            icns_path = _MAC_ICNS_PATH
+            png_path = _MAC_PNG_PATH
 
-            if icns_path.exists():
+            if _MAC_ICNS_EXISTS:
                 self._icns_path = str(icns_path)
 
             # 尝试使用 pyobjc 设置 Dock 图标
@@ -179,16 +257,22 @@ class MainWindow(ctk.CTk):
                 # 初始化 NSApplication（如果还没有）
                 app = AppKit.NSApplication.sharedApplication()
 
-                if png_path.exists():
+                # 已解码的图片直接复用
+                if _dock_image is not None:
+                    app.setApplicationIconImage_(_dock_image)
+                    return
+
+                if _MAC_PNG_EXISTS:
                     image = AppKit.NSImage.alloc().initWithContentsOfFile_(str(png_path))
                     if image and image.isValid():
+                        _dock_image = image
                         app.setApplicationIconImage_(image)
                         logger.info(f"已通过 Cocoa API 设置 Dock 图标: {png_path}")
                         return
             except ImportError:
                 pass
 
-            if icns_path.exists():
+            if _MAC_ICNS_EXISTS:
                 logger.info(f"找到 macOS 图标文件: {icns_path}")
                 logger.info("提示: 安装 pyobjc 可获得更好的 Dock 图标支持 (pip install pyobjc)")
         except Exception as e:
@@ -207,7 +291,7 @@ class MainWindow(ctk.CTk):
         title_label = ctk.CTkLabel(
             header_frame,
             text="DocuRuleFix - Word 文档处理工具",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self._FONT_TITLE
         )
         title_label.pack(side="left")
 
@@ -237,7 +321,7 @@ class MainWindow(ctk.CTk):
             text="仅校验",
             command=self._on_validate_click,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._FONT_ACTION
         )
         self.validate_button.pack(side="left", fill="x", expand=True, padx=(0, 5))
 
@@ -247,7 +331,7 @@ class MainWindow(ctk.CTk):
             text="校验并修复",
             command=self._on_fix_click,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._FONT_ACTION,
             fg_color=("dark blue", "blue")
         )
         self.fix_button.pack(side="left", fill="x", expand=True, padx=(0, 5))
@@ -258,7 +342,7 @@ class MainWindow(ctk.CTk):
             text="打开输出文件",
             command=self._on_open_output,
             height=40,
-            font=ctk.CTkFont(size=12),
+            font=self._FONT_SECONDARY,
             fg_color=("gray70", "gray30"),
             hover_color=("gray60", "gray20")
         )
@@ -266,29 +350,53 @@ class MainWindow(ctk.CTk):
         self.open_output_button.configure(state="disabled")
 
     def _process_progress_queue(self):
-        """处理进度队列（定时调用）"""
-        event = self.controller.progress_queue.get_event()
-
-        if event:
-            if event.event_type == ProgressEventType.PROGRESS:
-                current, total, message = event.data
-                self.progress_panel.update_progress(current, total, message)
+        """处理进度队列（定时调用）
 
-            elif event.event_type == ProgressEventType.LOG:
-                level, message = event.data
-                self.progress_panel.add_log(level, message)
+        每次取出队列中已有的全部事件（最多 QUEUE_BATCH_SIZE 个），
+        连续的进度事件只应用最后一个，日志批量写入。
+        """
+        events = self.controller.progress_queue.drain(self.QUEUE_BATCH_SIZE)
 
-            elif event.event_type == ProgressEventType.COMPLETE:
-                result = event.data[0]
-                self._on_processing_complete(result)
+        handlers = self._event_handlers
+        for event in events:
+            handler = handlers.get(event[0])
+            if handler:
+                handler(event[1:])
 
-            elif event.event_type == ProgressEventType.ERROR:
-                error_msg = event.data[0]
-                self.progress_panel.log_error(error_msg)
-                self._set_processing_state(False)
+        self._apply_progress_batch()
 
         # 继续处理队列
-        self.after(100, self._process_progress_queue)
+        self.after(self.QUEUE_POLL_MS, self._process_progress_queue)
+
+    def _handle_progress(self, data: tuple):
+        """进度事件：只记录最新进度，批末统一应用"""
+        self._batch_progress = data
+
+    def _handle_log(self, data: tuple):
+        """日志事件：(level, message)"""
+        self._batch_logs.append(data)
+
+    def _handle_complete(self, data: tuple):
+        """完成事件：(result,)"""
+        # 完成之前先应用已积累的日志和进度，保持顺序
+        self._apply_progress_batch()
+        self._on_processing_complete(data[0])
+
+    def _handle_error(self, data: tuple):
+        """错误事件：(error_msg,)"""
+        self._apply_progress_batch()
+        self.progress_panel.log_error(data[0])
+        self._set_processing_state(False)
+
+    def _apply_progress_batch(self):
+        """应用本批积累的进度和日志事件"""
+        if self._batch_logs:
+            self.progress_panel.add_logs(self._batch_logs)
+            self._batch_logs = []
+        if self._batch_progress is not None:
+            current, total, message = self._batch_progress
+            self._batch_progress = None
+            self.progress_panel.update_progress(current, total, message)
 
     def _on_file_selected(self, file_path: Optional[str]):
         """文件选择回调
@@ -296,7 +404,16 @@ class MainWindow(ctk.CTk):
         Args:
             file_path: 选中的文件路径
         """
-        # 清除之前的结果
+        # 清除之前的结果（同一空闲周期内的多次选择只清除一次）
+        if not self._clear_pending:
+            self._clear_pending = True
+            self.after_idle(self._do_clear_if_pending)
+
+    def _do_clear_if_pending(self):
+        """执行待处理的结果和日志清除"""
+        if not self._clear_pending:
+            return
+        self._clear_pending = False
         self.results_panel.clear_results()
         self.progress_panel.clear_logs()
 
@@ -319,6 +436,7 @@ class MainWindow(ctk.CTk):
             return
 
         file_path = self.file_selector.get_file()
+        self._do_clear_if_pending()
         self._set_processing_state(True)
         self.progress_panel.clear_logs()
         self.progress_panel.log_info(f"开始校验: {file_path}")
@@ -336,6 +454,7 @@ class MainWindow(ctk.CTk):
             return
 
         file_path = self.file_selector.get_file()
+        self._do_clear_if_pending()
         self._set_processing_state(True)
         self.progress_panel.clear_logs()
         self.progress_panel.log_info(f"开始校验并修复: {file_path}")
@@ -364,7 +483,7 @@ class MainWindow(ctk.CTk):
 
         # 显示结果
         errors = self.controller.get_all_errors()
-        self.results_panel.display_errors(errors)
+        self.results_panel.display_errors_async(errors)
 
         # 启用/禁用输出按钮
         if result.output_path and result.output_path != result.input_path:
@@ -380,10 +499,23 @@ class MainWindow(ctk.CTk):
         Args:
             processing: 是否正在处理
         """
+        # 状态未变化时无需重新配置按钮
+        if processing == self.is_processing:
+            return
         self.is_processing = processing
 
-        # 启用/禁用按钮
-        state = "disabled" if processing else "normal"
+        # 按钮更新合并到一次空闲回调中（点击处理函数已检查 is_processing）
+        if not self._button_state_pending:
+            self._button_state_pending = True
+            self.after_idle(self._apply_button_state)
+
+    def _apply_button_state(self):
+        """按最新的处理状态启用/禁用按钮（与已应用状态相同时跳过）"""
+        self._button_state_pending = False
+        state = "disabled" if self.is_processing else "normal"
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.validate_button.configure(state=state)
         self.fix_button.configure(state=state)
 
@@ -398,6 +530,7 @@ class MainWindow(ctk.CTk):
         # 取消正在进行的任务
         if self.is_processing:
             self.controller.cancel_processing()
+        self.controller.shutdown()
 
         # 保存偏好
         self.theme_manager.save_preferences()
@@ -4,8 +4,32 @@
 """
 
 import json
+import os
+import threading
+from collections import ChainMap
 from pathlib import Path
-import customtkinter as ctk
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# customtkinter 模块（首次应用主题时才导入，仅读写偏好时无需加载）
+_ctk = None
+
+
+def _get_ctk():
+    """导入并缓存 customtkinter 模块
+
+    Returns:
+        customtkinter 模块
+    """
+    global _ctk
+    if _ctk is None:
+        import customtkinter
+        _ctk = customtkinter
+    return _ctk
 
 
 class ThemeManager:
@@ -28,6 +52,9 @@ class ThemeManager:
         "dark-blue": "深蓝色"
     }
 
+    # 偏好设置延迟保存时间（秒），连续修改只写一次文件
+    SAVE_DELAY = 0.5
+
     def __init__(self, preferences_file: Path = None):
         """初始化主题管理器
 
@@ -38,15 +65,31 @@ class ThemeManager:
             preferences_file = Path.home() / ".docurulefix" / "preferences.json"
 
         self.preferences_file = preferences_file
-        self.preferences = self._load_preferences()
 
-    def _load_preferences(self) -> dict:
+        # 上次写入（或读取）文件时的用户偏好，未变化时跳过写入
+        self._last_saved = None
+
+        # 用户显式设置的偏好在前，默认值在后；只有用户偏好会写入文件
+        self._defaults: dict = {}
+        self._user: dict = {}
+        self.preferences: ChainMap[str, Any] = self._load_preferences()
+
+        # 延迟保存状态
+        self._dirty = False
+        self._save_timer = None
+        self._save_lock = threading.Lock()
+
+        # 已应用到 CustomTkinter 的外观模式和颜色主题
+        self._applied_mode = None
+        self._applied_theme = None
+
+    def _load_preferences(self) -> ChainMap:
         """加载偏好设置
 
         Returns:
-            偏好设置字典
+            偏好设置映射（用户偏好优先，缺失的键取默认值）
         """
-        default_preferences = {
+        self._defaults = {
             "appearance_mode": "dark",  # dark, light, system
             "color_theme": "blue",      # blue, green, dark-blue
             "title_mode": "2",          # 1=标准, 2=精简
@@ -55,31 +98,70 @@ class ThemeManager:
             "skip_corrupted": False
         }
 
+        self._user = {}
         if self.preferences_file.exists():
             try:
-                with open(self.preferences_file, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
-                    # 合并默认设置和加载的设置
-                    default_preferences.update(loaded)
+                data = self.preferences_file.read_bytes()
+                loaded = orjson.loads(data) if orjson else json.loads(data)
+                if isinstance(loaded, dict):
+                    self._user = loaded
+                    self._last_saved = dict(loaded)
             except (json.JSONDecodeError, IOError) as e:
                 print(f"加载偏好设置失败: {e}")
 
-        return default_preferences
+        # 不复制默认值，查找时按顺序回退
+        return ChainMap(self._user, self._defaults)
 
     def save_preferences(self) -> bool:
-        """保存偏好设置
+        """立即保存偏好设置（取消尚未执行的延迟保存）
 
         Returns:
             是否保存成功
         """
-        try:
-            self.preferences_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.preferences_file, 'w', encoding='utf-8') as f:
-                json.dump(self.preferences, f, indent=2, ensure_ascii=False)
-            return True
-        except IOError as e:
-            print(f"保存偏好设置失败: {e}")
-            return False
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+
+            # 内容与文件一致时无需写入
+            if self._user == self._last_saved:
+                self._dirty = False
+                return True
+
+            try:
+                self.preferences_file.parent.mkdir(parents=True, exist_ok=True)
+
+                # 只写入用户显式设置的偏好，默认值不落盘
+                if orjson:
+                    data = orjson.dumps(self._user, option=orjson.OPT_INDENT_2)
+                else:
+                    data = json.dumps(self._user, indent=2, ensure_ascii=False).encode('utf-8')
+
+                # 先写临时文件再替换，避免写到一半时留下损坏的文件
+                tmp_file = self.preferences_file.with_name(self.preferences_file.name + ".tmp")
+                tmp_file.write_bytes(data)
+                os.replace(tmp_file, self.preferences_file)
+
+                self._last_saved = dict(self._user)
+                self._dirty = False
+                return True
+            except IOError as e:
+                print(f"保存偏好设置失败: {e}")
+                return False
+
+    def _schedule_save(self):
+        """安排延迟保存，已有的保存计划会被推迟"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self._flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush(self):
+        """延迟保存的回调"""
+        if self._dirty:
+            self.save_preferences()
 
     def get(self, key: str, default=None):
         """获取偏好设置
@@ -94,17 +176,20 @@ class ThemeManager:
         return self.preferences.get(key, default)
 
     def set(self, key: str, value) -> bool:
-        """设置偏好并保存
+        """设置偏好并安排延迟保存
 
         Args:
             key: 设置键
             value: 设置值
 
         Returns:
-            是否保存成功
+            是否设置成功
         """
-        self.preferences[key] = value
-        return self.save_preferences()
+        with self._save_lock:
+            self._user[key] = value
+            self._dirty = True
+        self._schedule_save()
+        return True
 
     def get_appearance_mode(self) -> str:
         """获取外观模式
@@ -126,10 +211,14 @@ class ThemeManager:
         if mode not in self.MODES:
             return False
 
-        # 应用到 CustomTkinter
-        ctk.set_appearance_mode(mode)
+        # 应用到 CustomTkinter（未变化时跳过，避免所有组件重绘）
+        if mode != self._applied_mode:
+            _get_ctk().set_appearance_mode(mode)
+            self._applied_mode = mode
 
         # 保存到偏好
+        if mode == self.get_appearance_mode():
+            return True
         return self.set("appearance_mode", mode)
 
     def get_color_theme(self) -> str:
@@ -152,10 +241,14 @@ class ThemeManager:
         if theme not in self.COLOR_THEMES:
             return False
 
-        # 应用到 CustomTkinter
-        ctk.set_default_color_theme(theme)
+        # 应用到 CustomTkinter（未变化时跳过）
+        if theme != self._applied_theme:
+            _get_ctk().set_default_color_theme(theme)
+            self._applied_theme = theme
 
         # 保存到偏好
+        if theme == self.get_color_theme():
+            return True
         return self.set("color_theme", theme)
 
     def apply_saved_theme(self):
@@ -163,8 +256,13 @@ class ThemeManager:
         mode = self.get_appearance_mode()
         theme = self.get_color_theme()
 
-        ctk.set_appearance_mode(mode)
-        ctk.set_default_color_theme(theme)
+        # 只应用与当前不同的设置
+        if mode != self._applied_mode:
+            _get_ctk().set_appearance_mode(mode)
+            self._applied_mode = mode
+        if theme != self._applied_theme:
+            _get_ctk().set_default_color_theme(theme)
+            self._applied_theme = theme
 
     def toggle_theme(self) -> str:
         """切换主题（深色<->浅色）
@@ -1,13 +1,14 @@
 """线程辅助工具
 
-提供线程安全的通信机制和工作线程管理。
+提供线程安全的通信机制和后台任务管理。
 """
 
 import queue
 import threading
-from typing import Callable, Optional, Any, Tuple
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Optional, Any, List, Tuple
 from enum import Enum
-from dataclasses import dataclass
 
 
 class ProgressEventType(Enum):
@@ -18,43 +19,44 @@ class ProgressEventType(Enum):
     ERROR = "error"         # 错误发生
 
 
-@dataclass
-class ProgressEvent:
-    """进度事件数据类"""
-    event_type: ProgressEventType
-    data: Tuple[Any, ...]
+_PROGRESS = ProgressEventType.PROGRESS
+# 任务结束事件：入队时丢弃尚未取出的进度
+_FINAL_EVENTS = (ProgressEventType.COMPLETE, ProgressEventType.ERROR)
 
 
-class WorkerThread(threading.Thread):
-    """工作线程基类
+# 进度事件：队列中直接保存原始元组 (event_type, *data)，不再包装为对象
+ProgressEvent = Tuple[Any, ...]
 
-    在后台线程中执行任务，通过队列报告进度。
+
+class WorkerTask:
+    """后台任务基类
+
+    提交到线程池中执行，通过队列报告进度。
     """
 
-    def __init__(self, progress_queue: queue.Queue, **kwargs):
-        """初始化工作线程
+    def __init__(self, progress_queue: "ProgressQueue"):
+        """初始化后台任务
 
         Args:
             progress_queue: 进度消息队列
-            **kwargs: 其他参数
         """
-        super().__init__(**kwargs, daemon=True)
         self.progress_queue = progress_queue
-        self._cancel_flag = threading.Event()
+        # 单写单读的取消标志，普通布尔值即可（无需 Event 的锁）
+        self._cancelled = False
         self._result: Optional[Any] = None
         self._error: Optional[Exception] = None
 
     def cancel(self):
         """请求取消任务"""
-        self._cancel_flag.set()
+        self._cancelled = True
 
     def is_cancelled(self) -> bool:
         """检查是否被取消"""
-        return self._cancel_flag.is_set()
+        return self._cancelled
 
     def check_cancelled(self):
         """检查是否被取消，如果是则抛出异常"""
-        if self._cancel_flag.is_set():
+        if self._cancelled:
             raise InterruptedException("任务已被取消")
 
     @property
@@ -71,21 +73,12 @@ class WorkerThread(threading.Thread):
         """运行任务（子类实现）"""
         try:
             self._result = self.execute()
-            self.progress_queue.put((
-                ProgressEventType.COMPLETE,
-                self._result
-            ))
+            self.progress_queue.put_complete(self._result)
         except InterruptedException:
-            self.progress_queue.put((
-                ProgressEventType.ERROR,
-                "任务已被取消"
-            ))
+            self.progress_queue.put_error("任务已被取消")
         except Exception as e:
             self._error = e
-            self.progress_queue.put((
-                ProgressEventType.ERROR,
-                str(e)
-            ))
+            self.progress_queue.put_error(str(e))
 
     def execute(self) -> Any:
         """执行任务（子类实现）"""
@@ -100,10 +93,7 @@ class WorkerThread(threading.Thread):
             message: 进度消息
         """
         self.check_cancelled()
-        self.progress_queue.put((
-            ProgressEventType.PROGRESS,
-            current, total, message
-        ))
+        self.progress_queue.put_progress(current, total, message)
 
     def emit_log(self, level: str, message: str):
         """发送日志消息
@@ -113,10 +103,94 @@ class WorkerThread(threading.Thread):
             message: 日志消息
         """
         self.check_cancelled()
-        self.progress_queue.put((
-            ProgressEventType.LOG,
-            level, message
-        ))
+        self.progress_queue.put_log(level, message)
+
+
+class TaskRunner:
+    """后台任务执行器
+
+    在一个常驻的工作线程中依次执行 WorkerTask，避免每个任务创建新线程。
+    工作线程为守护线程：关闭窗口时不等待正在执行的任务结束，进程可以直接退出
+    （ThreadPoolExecutor 的工作线程会在解释器退出时被等待）。
+    """
+
+    def __init__(self):
+        """初始化任务执行器"""
+        self._jobs: "queue.SimpleQueue[Optional[Tuple[WorkerTask, Future]]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._task: Optional[WorkerTask] = None
+        self._future: Optional[Future] = None
+
+    def submit(self, task: WorkerTask) -> Future:
+        """提交任务
+
+        Args:
+            task: 后台任务
+
+        Returns:
+            任务的 Future
+        """
+        future = Future()
+        self._task = task
+        self._future = future
+        self._jobs.put((task, future))
+
+        # 首次提交时启动工作线程
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="docfix", daemon=True)
+            self._thread.start()
+        return future
+
+    def _worker(self):
+        """工作线程主循环：依次执行队列中的任务，收到 None 时退出"""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            task, future = job
+            # 已被取消的任务直接跳过
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(task.run())
+            except BaseException as e:
+                future.set_exception(e)
+
+    def is_running(self) -> bool:
+        """检查当前任务是否尚未结束"""
+        return self._future is not None and not self._future.done()
+
+    def cancel(self) -> bool:
+        """取消当前任务
+
+        尚未开始的任务直接取消；正在执行的任务设置取消标志，
+        在下一次报告进度或日志时中断。
+
+        Returns:
+            是否有任务被取消
+        """
+        if not self.is_running():
+            return False
+        if self._future.cancel():
+            # 任务未开始执行，由这里报告取消
+            self._task.progress_queue.put_error("任务已被取消")
+        else:
+            self._task.cancel()
+        return True
+
+    def shutdown(self):
+        """关闭执行器（不等待当前任务）
+
+        取消尚未开始的任务，并通知工作线程在当前任务结束后退出。
+        """
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                job[1].cancel()
+        self._jobs.put(None)
 
 
 class InterruptedException(Exception):
@@ -124,21 +198,48 @@ class InterruptedException(Exception):
     pass
 
 
-class ProgressQueue(queue.Queue):
+class ProgressQueue:
     """线程安全的进度队列
 
-    继承自 queue.Queue，提供更方便的接口。
+    日志、完成和错误事件存放在 deque 中（append/popleft 在 GIL 下是原子的，
+    无需 queue.Queue 的锁）；进度事件只保留最新一条，天然合并。
+
+    进度槽位的读写和完成/错误事件的入队在同一把锁下进行：完成/错误事件入队时
+    清空尚未取出的进度，drain 取出的进度因此不会晚于同一任务的完成/错误事件。
     """
 
+    def __init__(self):
+        """初始化进度队列"""
+        self._buf = deque()
+        self._latest_progress: Optional[tuple] = None
+        self._lock = threading.Lock()
+
+    def put(self, item: tuple):
+        """放入原始事件元组
+
+        Args:
+            item: (event_type, *data)
+        """
+        event_type = item[0]
+        if event_type is _PROGRESS:
+            with self._lock:
+                self._latest_progress = item
+        elif event_type in _FINAL_EVENTS:
+            self._put_final(item)
+        else:
+            self._buf.append(item)
+
     def put_progress(self, current: int, total: int, message: str = ""):
-        """放入进度更新
+        """放入进度更新（覆盖尚未取出的进度）
 
         Args:
             current: 当前进度
             total: 总数
             message: 进度消息
         """
-        self.put((ProgressEventType.PROGRESS, current, total, message))
+        item = (_PROGRESS, current, total, message)
+        with self._lock:
+            self._latest_progress = item
 
     def put_log(self, level: str, message: str):
         """放入日志消息
@@ -147,7 +248,7 @@ class ProgressQueue(queue.Queue):
             level: 日志级别
             message: 日志消息
         """
-        self.put((ProgressEventType.LOG, level, message))
+        self._buf.append((ProgressEventType.LOG, level, message))
 
     def put_complete(self, result: Any = None):
         """放入完成事件
@@ -155,7 +256,7 @@ class ProgressQueue(queue.Queue):
         Args:
             result: 结果数据
         """
-        self.put((ProgressEventType.COMPLETE, result))
+        self._put_final((ProgressEventType.COMPLETE, result))
 
     def put_error(self, error: str):
         """放入错误事件
@@ -163,7 +264,44 @@ class ProgressQueue(queue.Queue):
         Args:
             error: 错误消息
         """
-        self.put((ProgressEventType.ERROR, error))
+        self._put_final((ProgressEventType.ERROR, error))
+
+    def _put_final(self, item: tuple):
+        """放入完成/错误事件，并丢弃尚未取出的进度
+
+        Args:
+            item: (event_type, *data)
+        """
+        with self._lock:
+            self._latest_progress = None
+            self._buf.append(item)
+
+    def drain(self, max_items: int) -> List[ProgressEvent]:
+        """一次取出队列中已有的事件（非阻塞）
+
+        最新的进度事件排在最前面：进度槽位在锁内取出，完成/错误事件入队时会清空
+        槽位，因此取出的进度总是早于队列中同一任务的完成/错误事件产生。
+
+        Args:
+            max_items: 最多取出的事件数
+
+        Returns:
+            原始事件元组列表 (event_type, *data)
+        """
+        items = []
+        with self._lock:
+            progress = self._latest_progress
+            self._latest_progress = None
+        if progress is not None:
+            items.append(progress)
+
+        buf = self._buf
+        try:
+            for _ in range(max_items - len(items)):
+                items.append(buf.popleft())
+        except IndexError:
+            pass
+        return items
 
     def get_event(self, timeout: Optional[float] = None) -> Optional[ProgressEvent]:
         """获取事件（非阻塞）
@@ -172,13 +310,10 @@ class ProgressQueue(queue.Queue):
             timeout: 超时时间（秒）
 
         Returns:
-            ProgressEvent 或 None
+            原始事件元组 (event_type, *data) 或 None
         """
-        try:
-            event_type, *data = self.get_nowait()
-            return ProgressEvent(event_type, tuple(data))
-        except queue.Empty:
-            return None
+        events = self.drain(1)
+        return events[0] if events else None
 
 
 class ProcessCallback:
@@ -187,15 +322,15 @@ class ProcessCallback:
     用于在 RuleEngine 中设置进度回调。
     """
 
-    def __init__(self, progress_queue: queue.Queue, cancel_flag: threading.Event):
+    def __init__(self, progress_queue: "ProgressQueue", is_cancelled: Callable[[], bool]):
         """初始化处理回调
 
         Args:
             progress_queue: 进度消息队列
-            cancel_flag: 取消标志
+            is_cancelled: 返回是否已取消的函数
         """
         self.progress_queue = progress_queue
-        self.cancel_flag = cancel_flag
+        self.is_cancelled = is_cancelled
 
     def __call__(self, current: int, total: int, message: str = ""):
         """作为回调函数被调用
@@ -205,7 +340,7 @@ class ProcessCallback:
             total: 总数
             message: 进度消息
         """
-        if self.cancel_flag.is_set():
+        if self.is_cancelled():
             raise InterruptedException("处理已被取消")
 
         self.progress_queue.put_progress(current, total, message)
@@ -3,12 +3,27 @@
 This script creates icons for the application using PIL/Pillow.
 """
 
+import PIL
 from PIL import Image, ImageDraw
+import hashlib
 import os
 import sys
 import subprocess
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+
+# Size the icon is drawn at; every output size is resampled from it
+MASTER_SIZE = 1024
+
+_MASTER = None
+
+# Pillow-SIMD releases carry a ".postN" version suffix
+PILLOW_SIMD = ".post" in PIL.__version__
+
+# Records the inputs of the last generation next to the icons
+HASH_FILE = ".icon_hash"
 
 
 def create_icon(size=256):
@@ -68,15 +83,16 @@ def create_icon(size=256):
     line_spacing = size // 12
     start_y = doc_y + fold_size + size // 16
 
+    # Paste pre-filled strips instead of drawing each rectangle
+    # (draw.rectangle bounds are inclusive, hence the +1)
+    line_x = doc_x + size // 8
+    line_strip = Image.new('RGBA', (doc_width - size // 3 + 1, line_height + 1), accent)
+    # Last line differs in length to show variety
+    last_strip = Image.new('RGBA', (doc_width - size // 4 + 1, line_height + 1), accent)
+
     for i in range(4):
         y = start_y + i * line_spacing
-        # Last line shorter to show variety
-        line_width = doc_width - size // 4 if i == 3 else doc_width - size // 3
-        line_x = doc_x + size // 8
-        draw.rectangle(
-            [line_x, y, line_x + line_width, y + line_height],
-            fill=accent
-        )
+        img.paste(last_strip if i == 3 else line_strip, (line_x, y))
 
     # Draw checkmark (symbol for validation)
     check_size = size // 4
@@ -108,26 +124,148 @@ def create_icon(size=256):
     return img
 
 
-def generate_all_icons():
-    """Generate icons in multiple formats and sizes"""
+def _master():
+    """Return the master icon, drawing it on first use
+
+    Returns:
+        PIL Image object of MASTER_SIZE
+    """
+    global _MASTER
+    if _MASTER is None:
+        _MASTER = create_icon(MASTER_SIZE)
+    return _MASTER
+
+
+@lru_cache(maxsize=None)
+def render_icon(size):
+    """Resample the master icon to the given size
+
+    Sizes that are the master size divided by a power of two are halved
+    step by step with Image.reduce(2) (a fast 2x2 box filter), reusing the
+    next larger size. Other sizes are resampled from the master with
+    Lanczos. Results are cached and must not be modified by callers.
+
+    Args:
+        size: Icon size in pixels (square)
+
+    Returns:
+        PIL Image object
+    """
+    if size == MASTER_SIZE:
+        return _master()
+
+    ratio, remainder = divmod(MASTER_SIZE, size)
+    if remainder == 0 and ratio & (ratio - 1) == 0:
+        return render_icon(size * 2).reduce(2)
+    return _master().resize((size, size), Image.Resampling.LANCZOS)
+
+
+def _render_and_save(task, **save_options):
+    """Resample the master icon and save it as PNG
+
+    Args:
+        task: (size, path) tuple
+        **save_options: Extra options for Image.save (e.g. compress_level)
+
+    Returns:
+        Path of the saved file
+    """
+    size, path = task
+    render_icon(size).save(path, "PNG", **save_options)
+    return path
+
+
+def _render_all(tasks, **save_options):
+    """Resample several icons and save them in parallel
+
+    Pillow releases the GIL while encoding, so threads are enough and the
+    master image is shared instead of redrawn per process.
+
+    Args:
+        tasks: List of (size, path) tuples
+        **save_options: Extra options for Image.save
+
+    Returns:
+        List of the saved paths, in task order
+    """
+    # Resample up front, largest first, so each reduce(2) step reuses the
+    # cached larger size instead of workers racing to compute it
+    for size in sorted({size for size, _ in tasks}, reverse=True):
+        render_icon(size)
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(partial(_render_and_save, **save_options), tasks))
+
+
+def _icon_hash(sizes):
+    """Hash everything the generated icons depend on
+
+    Args:
+        sizes: PNG sizes to generate
+
+    Returns:
+        Hex digest of this script's source, the sizes and the platform
+    """
+    with open(os.path.abspath(__file__), "rb") as f:
+        source = f.read()
+    return hashlib.blake2b(source + repr((sizes, sys.platform)).encode()).hexdigest()
+
+
+def _icons_up_to_date(output_dir, sizes, digest):
+    """Check whether the icons were generated from the same inputs
+
+    Args:
+        output_dir: Directory containing the icons
+        sizes: PNG sizes to generate
+        digest: Hash of the current inputs
+
+    Returns:
+        True if the stored hash matches and all output files exist
+    """
+    try:
+        with open(os.path.join(output_dir, HASH_FILE), encoding="utf-8") as f:
+            if f.read().strip() != digest:
+                return False
+    except OSError:
+        return False
+
+    outputs = [f"icon_{size}x{size}.png" for size in sizes] + ["DocuRuleFix.ico"]
+    if sys.platform == 'darwin':
+        outputs.append("DocuRuleFix.icns")
+    return all(os.path.exists(os.path.join(output_dir, name)) for name in outputs)
+
+
+def generate_all_icons(force=False):
+    """Generate icons in multiple formats and sizes
+
+    Skips the work when the icons were already generated from the same
+    script and sizes.
+
+    Args:
+        force: Regenerate even if the icons are up to date
+    """
     # Output directory
     output_dir = os.path.dirname(os.path.abspath(__file__))
 
     # Generate different sizes
     sizes = [16, 32, 48, 64, 128, 256, 512]
 
+    digest = _icon_hash(sizes)
+    if not force and _icons_up_to_date(output_dir, sizes, digest):
+        print("Icons up to date")
+        return
+
     print("Generating icons...")
+    if not PILLOW_SIMD:
+        print("  Note: install Pillow-SIMD for faster icon resampling")
 
     # Generate PNG icons
-    for size in sizes:
-        img = create_icon(size)
-        png_path = os.path.join(output_dir, f"icon_{size}x{size}.png")
-        img.save(png_path, "PNG")
+    tasks = [(size, os.path.join(output_dir, f"icon_{size}x{size}.png")) for size in sizes]
+    for png_path in _render_all(tasks):
         print(f"  Created: {png_path}")
 
     # Generate ICO file (Windows) with multiple sizes
     ico_sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-    ico_img = create_icon(256)
+    ico_img = render_icon(256)
     ico_path = os.path.join(output_dir, "DocuRuleFix.ico")
     ico_img.save(ico_path, format="ICO", sizes=ico_sizes)
     print(f"  Created: {ico_path}")
@@ -140,6 +278,9 @@ def generate_all_icons():
             print(f"  Warning: Could not generate .icns file: {e}")
             print(f"  Note: .icns files require macOS and iconutil")
 
+    with open(os.path.join(output_dir, HASH_FILE), "w", encoding="utf-8") as f:
+        f.write(digest + "\n")
+
     print("\nAll icons generated successfully!")
 
 
@@ -173,20 +314,12 @@ def generate_icns(output_dir: str):
             (1024, "icon_512x512@2x.png"),  # 1024x1024
         ]
 
-        # Copy/scale images to iconset
-        for size, filename in iconset_sizes:
-            # Find the closest available size
-            available_sizes = [16, 32, 48, 64, 128, 256, 512]
-            closest = min(available_sizes, key=lambda x: abs(x - size))
-
-            # Load the closest size image
-            img = create_icon(closest)
-            if size != closest:
-                img = img.resize((size, size), Image.Resampling.LANCZOS)
-
-            # Save to iconset
-            dest_path = os.path.join(iconset_path, filename)
-            img.save(dest_path, "PNG")
+        # Scale the master image to each iconset size. These PNGs are
+        # temporary input for iconutil, so use fast, light compression.
+        _render_all([
+            (size, os.path.join(iconset_path, filename))
+            for size, filename in iconset_sizes
+        ], compress_level=1, optimize=False)
 
         # Use iconutil to create .icns
         subprocess.run([
@@ -200,4 +333,4 @@ def generate_icns(output_dir: str):
 
 
 if __name__ == "__main__":
-    generate_all_icons()
+    generate_all_icons(force="--force" in sys.argv[1:])
@@ -4,6 +4,7 @@
 """
 
 from abc import ABC, abstractmethod
+from collections import Counter
 from typing import List, Any, Dict, Optional
 from docx import Document
 
@@ -14,7 +15,11 @@ class ValidationError:
     用于记录文档校验过程中发现的错误
     """
 
-    def __init__(self, line_index: int, line_type: str, message: str, severity: str = "error"):
+    # 每个错误都会创建一个实例，使用 __slots__ 省去实例 __dict__
+    __slots__ = ('line_index', 'line_type', 'message', 'severity', 'code')
+
+    def __init__(self, line_index: int, line_type: str, message: str, severity: str = "error",
+                 code: Optional[str] = None):
         """
 
         Args:
@@ -22,11 +27,13 @@ class ValidationError:
             line_type: 行类型（'title', 'url', 'image', 'structure'等）
             message: 错误描述信息
             severity: 严重程度（'error', 'warning', 'info'）
+            code: 错误代码，由规则定义，用于区分同一行类型下的具体错误（如修复时分派）
         """
         self.line_index = line_index
         self.line_type = line_type
         self.message = message
         self.severity = severity
+        self.code = code
 
     def __repr__(self) -> str:
         return f"ValidationError(index={self.line_index}, type={self.line_type}, message={self.message})"
@@ -37,7 +44,8 @@ class ValidationError:
             "line_index": self.line_index,
             "line_type": self.line_type,
             "message": self.message,
-            "severity": self.severity
+            "severity": self.severity,
+            "code": self.code
         }
 
 
@@ -82,13 +90,14 @@ class BaseRule(ABC):
         """
         pass
 
-    def fix(self, document: Document) -> Document:
+    def fix(self, document: Document, errors: Optional[List[ValidationError]] = None) -> Document:
         """自动修复文档
 
         默认实现为返回原文档，子类可以覆盖此方法实现自动修复逻辑
 
         Args:
             document: 要修复的Word文档对象
+            errors: 已对该文档校验得到的错误列表，为 None 时由规则自行校验
 
         Returns:
             修复后的文档对象
@@ -121,12 +130,7 @@ class BaseRule(ABC):
         Returns:
             按类型分组的错误数量统计
         """
-        summary: Dict[str, int] = {}
-        for error in self.errors:
-            if error.line_type not in summary:
-                summary[error.line_type] = 0
-            summary[error.line_type] += 1
-        return summary
+        return dict(Counter(error.line_type for error in self.errors))
 
     def is_enabled(self) -> bool:
         """检查规则是否启用
@@ -4,11 +4,21 @@
 """
 
 import re
-from typing import List, Dict, Optional
+from collections import defaultdict
+from itertools import zip_longest
+from typing import List, Dict, Optional, Tuple
 from docx import Document
+from docx.oxml.ns import nsmap, qn
+from lxml import etree
 from docx.text.paragraph import Paragraph
 from loguru import logger
 
+try:
+    # 可选依赖 google-re2：线性时间的 DFA 引擎，不会出现回溯爆炸
+    import re2
+except ImportError:
+    re2 = None
+
 from rules.base_rule import BaseRule, ValidationError
 
 
@@ -25,6 +35,46 @@ class ThreeLineGroupValidationRule(BaseRule):
     REGEX_URL = r'^https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&\/=]*)$'
     # 标题行正则表达式：以数字开头，后跟 .、, 或 | 分隔符
     REGEX_TITLE = r'^\d+[.|,|)][\s\S]+'
+    # 预编译的正则表达式，所有实例共享（URL 优先使用 re2，未安装时回退到 re）
+    URL_PATTERN = (re2 or re).compile(REGEX_URL)
+    TITLE_PATTERN = re.compile(REGEX_TITLE)
+    # 标题序号相关的正则表达式（修复和解析标题时使用）
+    # REGEX_TITLE 中的序号分隔符（字符类 [.|,|)]），用于 str.startswith 判断
+    TITLE_SEPARATORS = ('.', '|', ',', ')')
+    TITLE_NUMBER_PATTERN = re.compile(r'^\d+[.|,|)]')
+    MISSING_SEPARATOR_PATTERN = re.compile(r'^(\d+)([^.|,|\s])')
+    # 图片尺寸（wp:extent 的 cx/cy 属性）和名称（wp:docPr 的 name 属性）所在元素的标签
+    EXTENT_TAG = qn('wp:extent')
+    DOCPR_TAG = qn('wp:docPr')
+    # 统计 wp:extent 元素数量的预编译 XPath（每个图片都有一个）
+    EXTENT_COUNT_XPATH = etree.XPath('count(.//wp:extent)', namespaces={'wp': nsmap['wp']})
+    # 段落的 w:r 子元素中是否含图片元素（标签与 IMAGE_TAGS 相同），整段一次查询
+    HAS_IMAGE_XPATH = etree.XPath(
+        'boolean(./w:r//a:graphic | ./w:r//a:blip | ./w:r//pic:pic)',
+        namespaces={prefix: nsmap[prefix] for prefix in ('w', 'a', 'pic')}
+    )
+    # 段落中各 run 的文本类子元素（与 CT_R.text 拼接的元素相同），整段一次查询
+    RUN_TEXT_XPATH = etree.XPath(
+        './w:r/w:br | ./w:r/w:cr | ./w:r/w:noBreakHyphen | ./w:r/w:ptab | ./w:r/w:t | ./w:r/w:tab',
+        namespaces={'w': nsmap['w']}
+    )
+    # 段落中 run 元素的标签
+    RUN_TAG = qn('w:r')
+    # 表示图片的元素标签（a:graphic、a:blip 嵌入图片、pic:pic）
+    IMAGE_TAGS = (qn('a:graphic'), qn('a:blip'), qn('pic:pic'))
+    # 标准模式标题必需的字符及其名称
+    TITLE_REQUIRED_CHARS = (('.', '点'), ('_', '下划线'), ('：', '冒号'))
+
+    # 错误代码（ValidationError.code），修复时按代码分派而不是匹配消息文本
+    CODE_GROUP_COUNT = 'group_count'                # 段落数量不是3的倍数
+    CODE_TITLE_EMPTY = 'title_empty'                # 标题行为空
+    CODE_TITLE_FORMAT = 'title_format'              # 标题行缺少"序号+分隔符"
+    CODE_TITLE_MISSING_CHAR = 'title_missing_char'  # 标题行缺少必需字符
+    CODE_URL_EMPTY = 'url_empty'                    # URL行为空
+    CODE_URL_FORMAT = 'url_format'                  # URL格式错误
+    CODE_IMAGE_TEXT = 'image_text'                  # 图片行包含文字
+    CODE_IMAGE_MISSING = 'image_missing'            # 图片行没有图片
+    CODE_IMAGE_MULTIPLE = 'image_multiple'          # 图片行包含多张图片
 
     def __init__(self, title_mode: str = "1", enabled: bool = True):
         """
@@ -44,97 +94,201 @@ class ThreeLineGroupValidationRule(BaseRule):
         Args:
             document: 要校验的Word文档对象
 
+        Returns:
+            发现的错误列表
+        """
+        return self._validate_all(document.paragraphs)
+
+    def _validate_all(self, paragraphs: List[Paragraph]) -> List[ValidationError]:
+        """校验已取得的段落列表（validate 的实现，fix 用它复用同一份段落列表）
+
+        Args:
+            paragraphs: 文档的段落列表
+
         Returns:
             发现的错误列表
         """
         self.clear_errors()
-        paragraphs = document.paragraphs
+        # 规则未启用时不做任何校验
+        if not self.enabled:
+            return self.errors
+
+        # 空文档没有可校验的行
+        if not paragraphs:
+            return self.errors
+
+        self._validate_paragraphs(paragraphs, *self._row_texts(paragraphs))
+        return self.errors
+
+    @staticmethod
+    def _row_texts(paragraphs: List[Paragraph]) -> Tuple[List[str], List[str]]:
+        """提取所有标题行和URL行去除首尾空白后的文本
 
+        Args:
+            paragraphs: 段落列表
+
+        Returns:
+            (标题行文本列表, URL行文本列表)，按组索引排列
+        """
+        return ([paragraph.text.strip() for paragraph in paragraphs[0::3]],
+                [paragraph.text.strip() for paragraph in paragraphs[1::3]])
+
+    def _validate_paragraphs(self, paragraphs: List[Paragraph],
+                             title_texts: List[str], url_texts: List[str]) -> None:
+        """按三行一组校验段落，错误追加到 self.errors
+
+        Args:
+            paragraphs: 段落列表
+            title_texts: 标题行文本列表（见 _row_texts）
+            url_texts: URL行文本列表（见 _row_texts）
+        """
         # 检查段落数量是否为3的倍数
         total_paragraphs = len(paragraphs)
         if total_paragraphs % 3 != 0:
             self.errors.append(ValidationError(
                 -1, 'structure',
-                f'段落数量({total_paragraphs})不是3的倍数，剩余{total_paragraphs % 3}行'
+                f'段落数量({total_paragraphs})不是3的倍数，剩余{total_paragraphs % 3}行',
+                code=self.CODE_GROUP_COUNT
             ))
 
-        # 遍历每三行一组
-        for i in range(0, len(paragraphs), 3):
-            group_index = i // 3
+        # 先批量校验所有标题行和URL行的格式，逐组校验时直接查询结果
+        # （map 直接调用预编译正则的匹配方法，无需逐行进入 Python 层的匹配函数）
+        title_matches = list(map(self.TITLE_PATTERN.match, title_texts))
+        valid_urls = self._match_url_rows(url_texts)
+
+        check_title_chars = self.title_mode == "1"
+
+        # 按标题模式在遍历前选定标题校验方法，循环内不再逐行判断模式
+        validate_title = self._validate_title_strict if check_title_chars else self._validate_title_format
+        validate_url = self._validate_url_line
+        validate_image = self._validate_image_line
+
+        # 格式正确的URL行不会产生错误；精简模式下格式正确的标题行同样如此。
+        # 这些行直接跳过，不再进入逐行校验方法
+        # 遍历每个完整的三行组（zip 直接产出三元组，无需逐行判断是否越界）
+        it = iter(paragraphs)
+        for group_index, (_, _, image_p) in enumerate(zip(it, it, it)):
+            i = group_index * 3
 
             # 检查标题行（第1行）
-            if i < len(paragraphs):
-                self._validate_title_line(paragraphs[i], i, group_index)
+            is_formatted = title_matches[group_index] is not None
+            if check_title_chars or not is_formatted:
+                validate_title(title_texts[group_index], i, group_index, is_formatted)
 
             # 检查URL行（第2行）
-            if i + 1 < len(paragraphs):
-                self._validate_url_line(paragraphs[i + 1], i + 1, group_index)
+            if group_index not in valid_urls:
+                validate_url(url_texts[group_index], i + 1, group_index, False)
 
             # 检查图片行（第3行）
-            if i + 2 < len(paragraphs):
-                self._validate_image_line(paragraphs[i + 2], i + 2, group_index)
-
-        return self.errors
-
-    def _validate_title_line(self, paragraph: Paragraph, index: int, group_index: int) -> None:
-        """校验标题行
+            validate_image(image_p, i + 2, group_index)
+
+        # 最后一组不足三行时，只校验存在的标题行和URL行
+        remainder = total_paragraphs % 3
+        if remainder:
+            group_index = total_paragraphs // 3
+            i = group_index * 3
+            is_formatted = title_matches[group_index] is not None
+            if check_title_chars or not is_formatted:
+                validate_title(title_texts[group_index], i, group_index, is_formatted)
+            if remainder == 2 and group_index not in valid_urls:
+                validate_url(url_texts[group_index], i + 1, group_index, False)
+
+    def _validate_title_format(self, text: str, index: int, group_index: int, is_formatted: bool) -> bool:
+        """校验标题行的基础格式（两种标题模式通用，精简模式只需此项）
 
         Args:
-            paragraph: 段落对象
+            text: 去除首尾空白后的段落文本
             index: 段落索引
             group_index: 组索引（第几组）
-        """
-        text = paragraph.text.strip()
+            is_formatted: 是否符合"序号+分隔符+内容"的基础格式（TITLE_PATTERN）
 
+        Returns:
+            True表示基础格式正确，False表示已记录错误
+        """
         # 空行检查
         if not text:
             self.errors.append(ValidationError(
                 index, 'title',
-                f'第{group_index + 1}组标题行为空'
+                f'第{group_index + 1}组标题行为空',
+                code=self.CODE_TITLE_EMPTY
             ))
-            return
+            return False
 
         # 检查基础格式（序号+分隔符+内容）
-        if not re.match(self.REGEX_TITLE, text):
+        if not is_formatted:
             self.errors.append(ValidationError(
                 index, 'title',
-                f'第{group_index + 1}组标题行格式错误，应为"序号+分隔符(.|,|)+内容"，当前为: "{text[:50]}..."'
+                f'第{group_index + 1}组标题行格式错误，应为"序号+分隔符(.|,|)+内容"，当前为: "{text[:50]}..."',
+                code=self.CODE_TITLE_FORMAT
             ))
+            return False
+
+        return True
+
+    def _validate_title_strict(self, text: str, index: int, group_index: int, is_formatted: bool) -> None:
+        """按标准模式校验标题行：基础格式正确后还须包含 . _ ： 三个字符
+
+        Args:
+            text: 去除首尾空白后的段落文本
+            index: 段落索引
+            group_index: 组索引（第几组）
+            is_formatted: 是否符合"序号+分隔符+内容"的基础格式（TITLE_PATTERN）
+        """
+        if not self._validate_title_format(text, index, group_index, is_formatted):
             return
 
-        # 标准模式检查
-        if self.title_mode == "1":
-            required_chars = {'.': '点', '_': '下划线', '：': '冒号'}
-            for char, char_name in required_chars.items():
-                if char not in text:
-                    self.errors.append(ValidationError(
-                        index, 'title',
-                        f'第{group_index + 1}组标题行缺少必需字符"{char}"({char_name})'
-                    ))
-
-    def _validate_url_line(self, paragraph: Paragraph, index: int, group_index: int) -> None:
+        # 三个字符都存在（最常见的情况）时直接返回，不再构建错误生成器
+        if '.' in text and '_' in text and '：' in text:
+            return
+        # 按固定顺序一次性追加所有缺少字符的错误
+        group_no = group_index + 1
+        code = self.CODE_TITLE_MISSING_CHAR
+        self.errors.extend(
+            ValidationError(index, 'title', f'第{group_no}组标题行缺少必需字符"{char}"({char_name})',
+                            code=code)
+            for char, char_name in self.TITLE_REQUIRED_CHARS
+            if char not in text
+        )
+
+    def _match_url_rows(self, texts: List[str]) -> set:
+        """批量检查多行文本是否为合法URL
+
+        map 直接调用预编译正则的匹配方法，无需逐行进入 Python 层的校验函数，
+        也无需为按行拼接后的整体扫描记录每行的偏移。
+
+        Args:
+            texts: 去除首尾空白后的各行文本
+
+        Returns:
+            合法URL行在 texts 中的位置集合
+        """
+        # 协议前缀不符时正则在第一个字符处即失败，无需再单独检查前缀
+        return {pos for pos, match in enumerate(map(self.URL_PATTERN.match, texts)) if match is not None}
+
+    def _validate_url_line(self, text: str, index: int, group_index: int, is_valid: bool) -> None:
         """校验URL行
 
         Args:
-            paragraph: 段落对象
+            text: 去除首尾空白后的段落文本
             index: 段落索引
             group_index: 组索引（第几组）
+            is_valid: URL格式是否正确（由 _match_url_rows 批量得到）
         """
-        text = paragraph.text.strip()
-
         # 空行检查
         if not text:
             self.errors.append(ValidationError(
                 index, 'url',
-                f'第{group_index + 1}组URL行为空'
+                f'第{group_index + 1}组URL行为空',
+                code=self.CODE_URL_EMPTY
             ))
             return
 
         # URL格式检查
-        if not re.match(self.REGEX_URL, text):
+        if not is_valid:
             self.errors.append(ValidationError(
                 index, 'url',
-                f'第{group_index + 1}组URL行格式错误: "{text[:80]}..."'
+                f'第{group_index + 1}组URL行格式错误: "{text[:80]}..."',
+                code=self.CODE_URL_FORMAT
             ))
 
     def _validate_image_line(self, paragraph: Paragraph, index: int, group_index: int) -> None:
@@ -150,28 +304,21 @@ class ThreeLineGroupValidationRule(BaseRule):
             index: 段落索引
             group_index: 组索引（第几组）
         """
-        # 获取完整文本内容（不strip，保留空格和换行）
-        full_text = paragraph.text
-
         # 检查是否有任何文字内容（包括空格、换行等）
         # 图片行应该是"纯净"的，除了图片run外不应有任何text run
-        if full_text:
-            # 进一步检查：是否所有run都是图片run
-            non_image_text_found = False
-            text_content = ""
-
-            for run in paragraph.runs:
-                if run.text and not self._is_image_only_run(run):
-                    non_image_text_found = True
-                    text_content += run.text
-
-            if non_image_text_found:
-                # 显示实际内容（用repr展示隐藏字符）
-                display_text = repr(full_text[:50]) if len(repr(full_text)) > 50 else repr(full_text)
-                self.errors.append(ValidationError(
-                    index, 'image',
-                    f'第{group_index + 1}组图片行包含图片以外的字符: {display_text}'
-                ))
+        # 有文字的run一定不是纯图片run，遇到第一个即可停止，无需先拼接整段文本
+        # （用预编译 XPath 一次取出所有 run 的文本类子元素，逐个转为文本，
+        # 不为每个 run 调用 run.text，后者每次都要编译并执行一条 XPath）
+        if any(map(str, self.RUN_TEXT_XPATH(paragraph._p))):
+            # 只在需要报告时获取完整文本内容（不strip，保留空格和换行）
+            full_text = paragraph.text
+            # 显示实际内容（用repr展示隐藏字符，只对前50个字符调用repr）
+            display_text = repr(full_text[:50])
+            self.errors.append(ValidationError(
+                index, 'image',
+                f'第{group_index + 1}组图片行包含图片以外的字符: {display_text}',
+                code=self.CODE_IMAGE_TEXT
+            ))
 
         # 检查图片数量 - 直接从 XML 中获取所有 drawing 元素
         image_count = self._count_images_in_paragraph(paragraph)
@@ -180,12 +327,14 @@ class ThreeLineGroupValidationRule(BaseRule):
         if image_count == 0:
             self.errors.append(ValidationError(
                 index, 'image',
-                f'第{group_index + 1}组图片行没有图片'
+                f'第{group_index + 1}组图片行没有图片',
+                code=self.CODE_IMAGE_MISSING
             ))
         elif image_count > 1:
             self.errors.append(ValidationError(
                 index, 'image',
-                f'第{group_index + 1}组图片行包含{image_count}张图片，只能有一张图片'
+                f'第{group_index + 1}组图片行包含{image_count}张图片，只能有一张图片',
+                code=self.CODE_IMAGE_MULTIPLE
             ))
 
     def _count_images_in_paragraph(self, paragraph: Paragraph) -> int:
@@ -197,14 +346,8 @@ class ThreeLineGroupValidationRule(BaseRule):
         Returns:
             图片数量
         """
-        # 直接从段落 XML 元素中查找所有的 drawing 元素
-        p_element = paragraph._element
-        xml_str = p_element.xml
-
-        # 使用正则表达式查找所有 wp:extent 元素（每个图片都有一个）
-        import re
-        extents = re.findall(r'<wp:extent\s+cx="[^"]*"\s+cy="[^"]*"', xml_str)
-        return len(extents)
+        # 在段落元素树上统计所有 wp:extent 元素（每个图片都有一个），无需序列化 XML
+        return int(self.EXTENT_COUNT_XPATH(paragraph._element))
 
     def _has_image(self, paragraph: Paragraph) -> bool:
         """检查段落是否包含图片
@@ -215,13 +358,9 @@ class ThreeLineGroupValidationRule(BaseRule):
         Returns:
             True表示包含图片，False表示不包含
         """
-        for run in paragraph.runs:
-            if 'graphic' in run._element.xml or 'pic:' in run._element.xml:
-                return True
-            # 检查是否有blip元素（嵌入图片）
-            if run._element.xpath('.//a:blip'):
-                return True
-        return False
+        # 直接在元素树上按标签查找，无需把 run 序列化为 XML 字符串；
+        # 预编译 XPath 一次检查所有 w:r 子元素（与 paragraph.runs 相同的 run）
+        return self.HAS_IMAGE_XPATH(paragraph._p)
 
     def _is_image_only_run(self, run) -> bool:
         """检查run是否只包含图片（不包含文字）
@@ -236,14 +375,13 @@ class ThreeLineGroupValidationRule(BaseRule):
         if run.text:
             return False
 
-        # 检查是否包含图片元素
-        xml = run._element.xml
-        if 'graphic' in xml or 'pic:' in xml:
-            return True
-        if run._element.xpath('.//a:blip'):
-            return True
+        # 没有子元素的空 run 不可能包含图片（len() 对 lxml 元素是常数时间）
+        element = run._element
+        if len(element) == 0:
+            return False
 
-        return False
+        # 检查是否包含图片元素（按标签查找，无需序列化 XML）
+        return next(element.iter(*self.IMAGE_TAGS), None) is not None
 
     def _is_valid_image(self, run) -> bool:
         """检查图片是否有效（高度不为0）
@@ -259,13 +397,10 @@ class ThreeLineGroupValidationRule(BaseRule):
 
         # 检查图片的尺寸（wp:extent）
         # XML中格式: <wp:extent cx="宽度" cy="高度"/>
-        xml = run._element.xml
-        import re
-        extent_match = re.search(r'<wp:extent\s+cx="(\d+)"\s+cy="(\d+)"', xml)
-        if extent_match:
-            height = int(extent_match.group(2))
+        extent = self._image_extent(run._element)
+        if extent is not None:
             # 高度大于0才认为是有效图片
-            return height > 0
+            return extent[1] > 0
 
         # 如果没有找到extent，也认为是有效的（以防格式不同）
         return True
@@ -281,20 +416,44 @@ class ThreeLineGroupValidationRule(BaseRule):
         """
         info = {'valid': False, 'width': 0, 'height': 0, 'name': ''}
 
-        xml = run._element.xml
-        import re
-        extent_match = re.search(r'<wp:extent\s+cx="(\d+)"\s+cy="(\d+)"', xml)
-        if extent_match:
-            info['width'] = int(extent_match.group(1))
-            info['height'] = int(extent_match.group(2))
+        element = run._element
+        extent = self._image_extent(element)
+        if extent is not None:
+            info['width'], info['height'] = extent
             info['valid'] = info['height'] > 0
 
-        name_match = re.search(r'<wp:docPr\s+id="[^"]*"\s+name="([^"]*)"', xml)
-        if name_match:
-            info['name'] = name_match.group(1)
+        name = self._image_name(element)
+        if name is not None:
+            info['name'] = name
 
         return info
 
+    def _image_extent(self, element) -> Optional[Tuple[int, int]]:
+        """读取元素中第一个图片的尺寸
+
+        Args:
+            element: run 等 XML 元素
+
+        Returns:
+            (宽度, 高度)，没有 wp:extent 元素时返回 None
+        """
+        extent = next(element.iter(self.EXTENT_TAG), None)
+        if extent is None:
+            return None
+        return int(extent.get('cx')), int(extent.get('cy'))
+
+    def _image_name(self, element) -> Optional[str]:
+        """读取元素中第一个图片的名称
+
+        Args:
+            element: run 等 XML 元素
+
+        Returns:
+            wp:docPr 的 name 属性，没有时返回 None
+        """
+        docpr = next(element.iter(self.DOCPR_TAG), None)
+        return docpr.get('name') if docpr is not None else None
+
     def apply(self, document: Document) -> Document:
         """应用规则到文档（校验并返回）
 
@@ -308,49 +467,56 @@ class ThreeLineGroupValidationRule(BaseRule):
         self.validate(document)
         return document
 
-    def fix(self, document: Document) -> Document:
+    def fix(self, document: Document, errors: Optional[List[ValidationError]] = None) -> Document:
         """自动修复文档
 
         Args:
             document: 要修复的Word文档对象
+            errors: 已对该文档校验得到的错误列表，为 None 时先校验
 
         Returns:
             修复后的文档对象
         """
-        # 先校验获取所有错误
-        self.validate(document)
+        # document.paragraphs 每次访问都会重建段落列表，这里只取一次，校验、修复和
+        # 修复后的复查共用；各项修复只改动段落内容，不增删段落，列表始终有效
+        paragraphs = document.paragraphs
 
-        if not self.errors:
+        # 调用方已校验过该文档时复用其结果，否则先校验获取所有错误
+        if errors is None:
+            errors = self._validate_all(paragraphs)
+
+        if not errors:
             return document
 
         # 记录原始错误数量
-        original_errors = len(self.errors)
+        original_errors = len(errors)
         logger.info(f"开始修复，共发现 {original_errors} 个错误")
 
         # 按错误类型分组
-        errors_by_index: Dict[int, List[ValidationError]] = {}
-        for error in self.errors:
-            if error.line_index not in errors_by_index:
-                errors_by_index[error.line_index] = []
+        errors_by_index: Dict[int, List[ValidationError]] = defaultdict(list)
+        for error in errors:
             errors_by_index[error.line_index].append(error)
 
         fixed_count = 0
 
+        total_paragraphs = len(paragraphs)
+
         # 逐个修复
-        for index, errors in sorted(errors_by_index.items()):
-            if index >= len(document.paragraphs):
+        for index, line_errors in sorted(errors_by_index.items()):
+            if index >= total_paragraphs:
                 continue
 
-            paragraph = document.paragraphs[index]
+            paragraph = paragraphs[index]
 
-            for error in errors:
+            for error in line_errors:
+                code = error.code
                 if error.line_type == 'image':
-                    if '包含文字内容' in error.message or '包含图片以外的字符' in error.message:
+                    if code == self.CODE_IMAGE_TEXT:
                         # 删除图片行中的文字
                         self._clear_text_from_paragraph(paragraph)
                         fixed_count += 1
                         logger.info(f"已修复第{index // 3 + 1}组图片行: 清除了图片中的文字")
-                    elif '张图片，只能有一张图片' in error.message:
+                    elif code == self.CODE_IMAGE_MULTIPLE:
                         # 删除多余的图片，只保留第一张
                         group_index = index // 3
                         logger.info(f"开始修复第{group_index + 1}组图片行: 处理多余图片")
@@ -360,16 +526,15 @@ class ThreeLineGroupValidationRule(BaseRule):
                 elif error.line_type == 'title':
                     # 尝试修复标题格式
                     original_text = paragraph.text
-                    self._fix_title_format(paragraph, index)
+                    self._fix_title_format(paragraph, index, original_text)
                     if paragraph.text != original_text:
                         fixed_count += 1
                         logger.info(f"已修复第{index // 3 + 1}组标题行: '{original_text[:30]}...' -> '{paragraph.text[:30]}...'")
-                elif error.line_type == 'url' and '格式错误' in error.message:
+                elif error.line_type == 'url' and code == self.CODE_URL_FORMAT:
                     # 标记无效URL或删除
                     pass
 
         # 处理段落数量不是3的倍数的情况
-        total_paragraphs = len(document.paragraphs)
         if total_paragraphs % 3 != 0:
             remainder = total_paragraphs % 3
             # 删除末尾多余的段落
@@ -377,9 +542,13 @@ class ThreeLineGroupValidationRule(BaseRule):
                 # 注意：这里需要从末尾删除
                 pass  # python-docx不支持直接删除段落，需要其他处理方式
 
-        # 修复完成后，再次校验以确认剩余的错误
+        # 修复完成后，再次校验以确认剩余的错误（界面在修复后显示 self.errors）
         # 不要清空错误列表，而是重新校验来获取剩余问题
-        self.validate(document)
+        if fixed_count:
+            self._validate_all(paragraphs)
+        else:
+            # 没有任何修复生效时校验所依据的文本和图片都未改变，剩余错误即原错误
+            self.errors = list(errors)
         remaining_errors = len(self.errors)
 
         logger.info(f"修复完成: 尝试修复 {fixed_count} 个问题，剩余 {remaining_errors} 个问题")
@@ -411,57 +580,27 @@ class ThreeLineGroupValidationRule(BaseRule):
         Returns:
             删除的图片数量
         """
-        # 直接从段落 XML 元素中查找所有包含图片的 w:r 元素
-        p_element = paragraph._element
-        xml_str = p_element.xml
-
-        import re
-        import xml.etree.ElementTree as ET
-
-        # 使用正则表达式提取所有图片信息
-        # 查找所有 <w:r>...</w:r> 块，然后从中提取图片信息
-        # 但由于 XML 是命名空间的，我们需要用更复杂的方法
-
-        # 策略：直接操作段落元素的子元素
-        # 找到所有包含 drawing 的 w:r 子元素
-
+        # 直接遍历段落元素的 w:r 子元素，从元素属性读取图片信息，无需序列化 XML
         removed_count = 0
 
-        # 获取所有 w:r 子元素
-        # 需要考虑命名空间
-        ns = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
-
-        # 直接遍历子元素
-        r_elements_to_remove = []
-
-        # 收集所有包含 drawing 的子元素及其信息
-        image_elements = []  # (element, info_dict)
-
-        for child in list(p_element):
-            # 检查是否是 w:r 元素
-            tag_name = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag_name != 'r':
-                continue
-
-            # 检查这个 w:r 是否包含 drawing
-            child_xml = child.xml
+        # 收集所有包含图片的 run 元素及其信息
+        image_elements = []  # info_dict 列表
 
+        for child in paragraph._element.iterchildren(self.RUN_TAG):
             # 查找 wp:extent 和 wp:docPr
-            extent_match = re.search(r'<wp:extent\s+cx="(\d+)"\s+cy="(\d+)"', child_xml)
-            docPr_match = re.search(r'<wp:docPr\s+id="[^"]*"\s+name="([^"]*)"', child_xml)
+            extent = self._image_extent(child)
+            name = self._image_name(child)
 
-            if extent_match or docPr_match:
+            if extent is not None or name is not None:
                 # 这是一个图片 run
-                width = int(extent_match.group(1)) if extent_match else 0
-                height = int(extent_match.group(2)) if extent_match else 0
-                name = docPr_match.group(1) if docPr_match else "未知"
+                width, height = extent if extent is not None else (0, 0)
 
                 info = {
                     'element': child,
                     'width': width,
                     'height': height,
                     'valid': height > 0,
-                    'name': name
+                    'name': name if name is not None else "未知"
                 }
                 image_elements.append(info)
 
@@ -495,47 +634,59 @@ class ThreeLineGroupValidationRule(BaseRule):
 
         return removed_count
 
-    def _fix_title_format(self, paragraph: Paragraph, index: int) -> None:
+    def _fix_title_format(self, paragraph: Paragraph, index: int, text: Optional[str] = None) -> None:
         """尝试修复标题格式
 
         Args:
             paragraph: 段落对象
             index: 段落索引
+            text: 已提取的段落文本，为 None 时从段落读取
         """
-        text = paragraph.text.strip()
-
-        # 检查是否以数字开头但没有正确的分隔符
-        # 匹配：数字后直接跟非分隔符字符（.|,|）
-        match = re.match(r'^(\d+)([^.|,|\s])', text)
-        if match:
-            # 在数字后面添加 . 分隔符，保留后面的字符
-            number = match.group(1)
-            # rest 从数字后开始，不包括被匹配的非分隔符字符
-            rest = text[len(number):]
-            new_text = f"{number}.{rest}"
-
-            # 更新段落文本
-            if paragraph.runs:
-                paragraph.runs[0].text = new_text
-                # 清除其他run的文本
-                for run in paragraph.runs[1:]:
-                    run.text = ""
-        elif not re.match(r'^\d', text):
+        if text is None:
+            text = paragraph.text
+        text = text.strip()
+
+        # 按首字符分派：只有以数字开头时才需要运行正则
+        if text[:1].isdecimal():
+            # 检查是否以数字开头但没有正确的分隔符
+            # 匹配：数字后直接跟非分隔符字符（.|,|）
+            match = self.MISSING_SEPARATOR_PATTERN.match(text)
+            if match:
+                # 在数字后面添加 . 分隔符，保留后面的字符
+                number = match.group(1)
+                # rest 从数字后开始，不包括被匹配的非分隔符字符
+                rest = text[len(number):]
+                new_text = f"{number}.{rest}"
+
+                # 更新段落文本
+                self._replace_paragraph_text(paragraph, new_text)
+        else:
             # 如果缺少序号，尝试添加
             group_num = (index // 3) + 1
             # 检查是否已经有分隔符，有则直接加序号
-            if re.match(r'^[.|,|)]', text):
+            if text.startswith(self.TITLE_SEPARATORS):
                 new_text = f"{group_num}{text}"
             else:
                 # 尝试添加序号和分隔符
                 new_text = f"{group_num}. {text}"
 
             # 更新段落文本
-            if paragraph.runs:
-                paragraph.runs[0].text = new_text
-                # 清除其他run的文本
-                for run in paragraph.runs[1:]:
-                    run.text = ""
+            self._replace_paragraph_text(paragraph, new_text)
+
+    @staticmethod
+    def _replace_paragraph_text(paragraph: Paragraph, new_text: str) -> None:
+        """把新文本写入第一个run，并清除其他run的文本
+
+        Args:
+            paragraph: 段落对象
+            new_text: 新的段落文本
+        """
+        # paragraph.runs 每次访问都会重建 Run 列表，只取一次
+        runs = paragraph.runs
+        if runs:
+            runs[0].text = new_text
+            for run in runs[1:]:
+                run.text = ""
 
     def parse_title(self, title_text: str) -> Dict[str, str]:
         """解析标题行，提取字段
@@ -550,7 +701,7 @@ class ThreeLineGroupValidationRule(BaseRule):
 
         try:
             # 去除序号部分
-            content = re.sub(r'^\d+[.|,|)]', '', title_text).strip()
+            content = self.TITLE_NUMBER_PATTERN.sub('', title_text, count=1).strip()
 
             if self.title_mode == "1":
                 # 标准模式：提取舆论场、来源、标题
@@ -582,42 +733,63 @@ class ThreeLineGroupValidationRule(BaseRule):
         Returns:
             包含所有组数据的列表
         """
-        results = []
         paragraphs = document.paragraphs
+        return self._parse_groups(paragraphs, *self._row_texts(paragraphs))
+
+    def _parse_groups(self, paragraphs: List[Paragraph],
+                      title_texts: List[str], url_texts: List[str]) -> List[Dict[str, any]]:
+        """按三行一组解析段落
 
-        for i in range(0, len(paragraphs), 3):
+        Args:
+            paragraphs: 段落列表
+            title_texts: 标题行文本列表（见 _row_texts）
+            url_texts: URL行文本列表（见 _row_texts）
+
+        Returns:
+            包含所有组数据的列表
+        """
+        results = []
+
+        # 预先建立 (行索引, 行类型) 集合，避免每行都遍历一次错误列表
+        error_keys = frozenset((e.line_index, e.line_type) for e in self.errors)
+        # 格式正确的文档没有错误，此时跳过每行的键构造和集合查询
+        has_errors = bool(error_keys)
+
+        # 直接按组并行遍历已提取的标题行、URL行文本和图片行段落，无需再按组索引取文本；
+        # 每组都有标题行，只有最后一组可能缺少URL行和图片行（此时为 None）
+        # 与校验相同，所有URL行一次批量匹配
+        valid_urls = self._match_url_rows(url_texts)
+        rows = zip_longest(title_texts, url_texts, paragraphs[2::3])
+        for group_index, (title_text, url_text, image_p) in enumerate(rows):
+            i = group_index * 3
             group_data = {
-                'group_index': i // 3,
+                'group_index': group_index,
                 'title_line': None,
                 'url_line': None,
                 'image_line': None
             }
 
             # 标题行
-            if i < len(paragraphs):
-                title_text = paragraphs[i].text.strip()
-                group_data['title_line'] = {
-                    'text': title_text,
-                    'parsed': self.parse_title(title_text),
-                    'has_error': any(e.line_index == i and e.line_type == 'title' for e in self.errors)
-                }
+            group_data['title_line'] = {
+                'text': title_text,
+                'parsed': self.parse_title(title_text),
+                'has_error': has_errors and (i, 'title') in error_keys
+            }
 
             # URL行
-            if i + 1 < len(paragraphs):
-                url_text = paragraphs[i + 1].text.strip()
+            if url_text is not None:
                 group_data['url_line'] = {
                     'text': url_text,
-                    'is_valid': bool(re.match(self.REGEX_URL, url_text)),
-                    'has_error': any(e.line_index == i + 1 and e.line_type == 'url' for e in self.errors)
+                    'is_valid': group_index in valid_urls,
+                    'has_error': has_errors and (i + 1, 'url') in error_keys
                 }
 
             # 图片行
-            if i + 2 < len(paragraphs):
-                paragraph = paragraphs[i + 2]
+            if image_p is not None:
                 group_data['image_line'] = {
-                    'text': paragraph.text.strip(),
-                    'has_image': self._has_image(paragraph),
-                    'has_error': any(e.line_index == i + 2 and e.line_type == 'image' for e in self.errors)
+                    'text': image_p.text.strip(),
+                    'has_image': self._has_image(image_p),
+                    'has_error': has_errors and (i + 2, 'image') in error_keys
                 }
 
             results.append(group_data)
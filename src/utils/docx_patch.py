@@ -1,11 +1,18 @@
 """python-docx 库的补丁模块
 
-修复 python-docx 无法处理损坏的文档引用（如 ../NULL）的问题
+修复 python-docx 无法处理损坏的文档引用（如 ../NULL）的问题，
+并避免保存时重复压缩已压缩的图片
 """
 
+from zipfile import ZIP_STORED
+
 from docx.opc.pkgreader import _SerializedRelationships, _SerializedRelationship
+from docx.opc.phys_pkg import _ZipPkgWriter
 from docx.opc.oxml import parse_xml
 
+# 本身已压缩的图片格式，保存时直接存储，不再 deflate
+STORED_EXTENSIONS = frozenset({'jpeg', 'jpg', 'png', 'gif'})
+
 
 def load_from_xml_v2(baseURI, rels_item_xml):
     """
@@ -27,9 +34,25 @@ def load_from_xml_v2(baseURI, rels_item_xml):
     return srels
 
 
+def zip_write_v2(self, pack_uri, blob):
+    """
+    修复版本的 _ZipPkgWriter.write 方法
+
+    将 *blob* 写入 zip 包中 *pack_uri* 对应的成员。
+
+    修复内容：JPEG/PNG/GIF 图片已经是压缩格式，使用 ZIP_STORED 直接存储，
+    跳过无效的 deflate 压缩；其他部件仍按默认方式压缩
+    """
+    if pack_uri.ext.lower() in STORED_EXTENSIONS:
+        self._zipf.writestr(pack_uri.membername, blob, compress_type=ZIP_STORED)
+    else:
+        self._zipf.writestr(pack_uri.membername, blob)
+
+
 def apply_patch():
     """应用补丁到 python-docx 库"""
     _SerializedRelationships.load_from_xml = load_from_xml_v2
+    _ZipPkgWriter.write = zip_write_v2
 
 
 # 自动应用补丁（当模块被导入时）
@@ -0,0 +1,14 @@
+"""测试公共配置"""
+
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# 在导入任何使用 python-docx 的模块之前，先应用补丁
+from utils.docx_patch import apply_patch  # noqa: E402
+
+apply_patch()
+
@@ -0,0 +1,90 @@
+"""批量处理测试"""
+
+import os
+import shutil
+
+import pytest
+from docx import Document
+from loguru import logger
+
+from cli import run
+from core.document_processor import DocumentProcessor
+from core.rule_engine import RuleEngine
+from rules.structure_rules import ThreeLineGroupValidationRule
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_DOCX = os.path.join(TESTS_DIR, '1.docx')
+SAMPLE_FIXED_DOCX = os.path.join(TESTS_DIR, '1_fixed.docx')
+
+RULE_CONFIGS = [{'type': 'structure_validation', 'config': {'title_mode': '1'}}]
+
+
+def _copy_samples(tmp_path):
+    """复制样例文档到临时目录"""
+    paths = []
+    for name, sample in (('a.docx', SAMPLE_DOCX), ('b.docx', SAMPLE_FIXED_DOCX)):
+        path = tmp_path / name
+        shutil.copyfile(sample, path)
+        paths.append(str(path))
+    return paths
+
+
+def _fixed_texts(path):
+    """用单进程处理器修复文档，返回修复后的段落文本"""
+    rule_engine = RuleEngine()
+    rule_engine.register_rule(ThreeLineGroupValidationRule(title_mode='1'))
+    processor = DocumentProcessor(rule_engine, create_backup=False)
+    output_path = path + '.expected.docx'
+    processor.process(path, output_path=output_path, fix_errors=True)
+    return [p.text for p in Document(output_path).paragraphs]
+
+
+def test_process_many_matches_sequential(tmp_path):
+    paths = _copy_samples(tmp_path)
+
+    results = DocumentProcessor.process_many(paths, RULE_CONFIGS, fix_errors=True,
+                                             output_suffix='_fixed', max_workers=2)
+
+    assert [r.input_path for r in results] == paths
+    for path, result in zip(paths, results):
+        assert result.success
+        assert result.output_path == path[:-len('.docx')] + '_fixed.docx'
+        fixed_texts = [p.text for p in Document(result.output_path).paragraphs]
+        assert fixed_texts == _fixed_texts(path)
+
+
+def test_process_many_reports_missing_file(tmp_path):
+    missing = str(tmp_path / 'missing.docx')
+
+    results = DocumentProcessor.process_many([missing], RULE_CONFIGS, max_workers=1)
+
+    assert len(results) == 1
+    assert not results[0].success
+    assert missing in results[0].message
+
+
+def test_process_many_empty():
+    assert DocumentProcessor.process_many([], RULE_CONFIGS) == []
+
+
+@pytest.fixture
+def cli_logger():
+    """命令行入口会替换日志处理器，测试结束后移除"""
+    yield
+    logger.remove()
+
+
+def test_cli_fixes_multiple_files(tmp_path, monkeypatch, cli_logger):
+    monkeypatch.chdir(tmp_path)
+    paths = _copy_samples(tmp_path)
+
+    assert run(['main.py', *paths, '--fix']) == 0
+
+    for path in paths:
+        assert os.path.exists(path[:-len('.docx')] + '_fixed.docx')
+
+
+def test_cli_batch_missing_file_exit_code(tmp_path, monkeypatch, cli_logger):
+    monkeypatch.chdir(tmp_path)
+    paths = _copy_samples(tmp_path)
+
+    assert run(['main.py', *paths, str(tmp_path / 'missing.docx')]) == 1
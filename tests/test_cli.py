@@ -0,0 +1,30 @@
+"""命令行入口测试"""
+
+import pytest
+from loguru import logger
+
+from cli import build_parser, run
+
+
+@pytest.fixture(autouse=True)
+def cli_logger():
+    """命令行入口会替换日志处理器，测试结束后移除"""
+    yield
+    logger.remove()
+
+
+def test_missing_file_exit_code(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+
+    assert run(['main.py', str(tmp_path / 'missing.docx')]) == 1
+    assert '文件不存在' in capsys.readouterr().out
+
+
+def test_no_arguments_prints_usage(capsys):
+    assert run(['main.py']) == 0
+    assert '使用方法' in capsys.readouterr().out
+
+
+def test_parser_rejects_unknown_mode():
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(['a.docx', '--mode=other'])
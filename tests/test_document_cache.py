@@ -0,0 +1,103 @@
+"""文档处理器的文档缓存测试"""
+
+import os
+import shutil
+
+import pytest
+from docx import Document
+
+import core.document_processor as document_processor
+from core.document_processor import DocumentProcessor
+from core.rule_engine import RuleEngine
+from rules.structure_rules import ThreeLineGroupValidationRule
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_DOCX = os.path.join(TESTS_DIR, '1.docx')
+SAMPLE_FIXED_DOCX = os.path.join(TESTS_DIR, '1_fixed.docx')
+
+
+@pytest.fixture
+def processor():
+    rule_engine = RuleEngine()
+    rule_engine.register_rule(ThreeLineGroupValidationRule(title_mode='1'))
+    return DocumentProcessor(rule_engine, create_backup=False)
+
+
+@pytest.fixture
+def load_count(monkeypatch):
+    """统计实际解析 docx 文件的次数"""
+    calls = []
+
+    def counting_document(path):
+        calls.append(path)
+        return Document(path)
+
+    monkeypatch.setattr(document_processor, 'Document', counting_document)
+    return calls
+
+
+@pytest.fixture
+def sample(tmp_path):
+    path = tmp_path / 'sample.docx'
+    shutil.copyfile(SAMPLE_DOCX, path)
+    return str(path)
+
+
+def test_validate_only_reuses_parsed_document(processor, load_count, sample):
+    first = processor.validate_only(sample)
+    second = processor.validate_only(sample)
+
+    assert first.errors_count == second.errors_count > 0
+    assert len(load_count) == 1
+
+
+def test_process_takes_document_out_of_cache(processor, load_count, sample, tmp_path):
+    processor.validate_only(sample)
+    output_path = str(tmp_path / 'out.docx')
+
+    result = processor.process(sample, output_path=output_path, fix_errors=True)
+
+    assert result.success
+    assert len(load_count) == 1
+    # 修复修改了取出的文档，再次校验必须重新解析
+    processor.validate_only(sample)
+    assert len(load_count) == 2
+
+
+def test_cached_process_matches_uncached(processor, sample, tmp_path):
+    uncached_path = str(tmp_path / 'uncached.docx')
+    processor.process(sample, output_path=uncached_path, fix_errors=True)
+
+    processor.validate_only(sample)
+    cached_path = str(tmp_path / 'cached.docx')
+    processor.process(sample, output_path=cached_path, fix_errors=True)
+
+    assert ([p.text for p in Document(cached_path).paragraphs]
+            == [p.text for p in Document(uncached_path).paragraphs])
+
+
+def test_changed_file_is_reloaded(processor, load_count, sample):
+    before = processor.validate_only(sample)
+    shutil.copyfile(SAMPLE_FIXED_DOCX, sample)
+
+    after = processor.validate_only(sample)
+
+    assert len(load_count) == 2
+    assert after.errors_count != before.errors_count
+
+
+def test_cache_size_is_bounded(processor, load_count, tmp_path, monkeypatch):
+    monkeypatch.setattr(document_processor, 'DOCUMENT_CACHE_SIZE', 2)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f'{i}.docx'
+        shutil.copyfile(SAMPLE_DOCX, path)
+        paths.append(str(path))
+
+    for path in paths:
+        processor.validate_only(path)
+    # 最早的文档已被淘汰，需要重新解析；最近的文档仍在缓存中
+    processor.validate_only(paths[2])
+    assert len(load_count) == 3
+    processor.validate_only(paths[0])
+    assert len(load_count) == 4
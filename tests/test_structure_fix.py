@@ -0,0 +1,74 @@
+"""三行一组结构规则的修复测试"""
+
+import os
+
+from docx import Document
+
+from rules.base_rule import ValidationError
+from rules.structure_rules import ThreeLineGroupValidationRule
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_DOCX = os.path.join(TESTS_DIR, '1.docx')
+
+
+def _make_document(lines):
+    """按给定文本创建文档，每个文本一个段落"""
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    return document
+
+
+def _texts(document):
+    return [p.text for p in document.paragraphs]
+
+
+def test_fix_dispatches_on_code_not_message():
+    rule = ThreeLineGroupValidationRule(title_mode='2')
+    document = _make_document(['1.标题', 'https://example.com', '多余的文字'])
+
+    # 消息中含有“包含图片以外的字符”，但错误代码是“没有图片”，不应清除文字
+    errors = [ValidationError(2, 'image', '第1组图片行包含图片以外的字符',
+                              code=ThreeLineGroupValidationRule.CODE_IMAGE_MISSING)]
+    rule.fix(document, errors=errors)
+    assert _texts(document)[2] == '多余的文字'
+
+    # 错误代码为“包含文字”时，即使消息不含关键字也会清除文字
+    errors = [ValidationError(2, 'image', '图片行有问题',
+                              code=ThreeLineGroupValidationRule.CODE_IMAGE_TEXT)]
+    rule.fix(document, errors=errors)
+    assert _texts(document)[2] == ''
+
+
+def test_fix_with_given_errors_matches_fix_without():
+    rule = ThreeLineGroupValidationRule(title_mode='1')
+
+    expected = Document(SAMPLE_DOCX)
+    rule.fix(expected)
+    expected_errors = [(e.line_index, e.code) for e in rule.errors]
+
+    document = Document(SAMPLE_DOCX)
+    errors = rule.validate(document)
+    assert errors
+    rule.fix(document, errors=list(errors))
+
+    assert _texts(document) == _texts(expected)
+    assert [(e.line_index, e.code) for e in rule.errors] == expected_errors
+
+
+def test_fix_with_empty_errors_leaves_document_unchanged():
+    rule = ThreeLineGroupValidationRule(title_mode='2')
+    document = _make_document(['标题', 'https://example.com', '多余的文字'])
+
+    rule.fix(document, errors=[])
+
+    assert _texts(document) == ['标题', 'https://example.com', '多余的文字']
+
+
+def test_fix_title_format():
+    rule = ThreeLineGroupValidationRule(title_mode='2')
+    document = _make_document(['3标题', 'https://example.com', ''])
+
+    rule.fix(document)
+
+    assert _texts(document)[0] == '3.标题'